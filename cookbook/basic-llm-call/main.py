@@ -11,7 +11,6 @@ Usage:
 """
 
 import click
-from dd_llm import call_llm, get_adapter, list_adapters, UnifiedLLMProvider
 
 
 @click.command()
@@ -20,6 +19,8 @@ from dd_llm import call_llm, get_adapter, list_adapters, UnifiedLLMProvider
 @click.option("--model", default=None, help="Model name (provider-specific)")
 def main(prompt, provider, model):
     """Call any LLM provider with a single function."""
+    # Imported here so `--help` does not pay for loading dd-llm
+    from dd_llm import call_llm, get_adapter, list_adapters
 
     print(f"Available providers: {list_adapters()}")
     print()
@@ -3,9 +3,11 @@
 Demonstrates:
 - Collecting input_tokens, output_tokens, cost_usd, latency_ms from LLMResponse
 - Building a CallRecord dataclass to store per-call metrics
-- A CostTracker helper that accumulates and reports stats across providers
+- A CostTracker helper that accumulates and reports stats across providers,
+  storing metrics column-wise in typed arrays
 - Simulating calls to multiple "providers" with different cost profiles
 - Running without a real API key using configurable mock adapters
+- Sending each provider's prompts as one ``batch_call()``, providers in parallel
 
 Usage:
     python main.py                              # demo (mock, no API key)
@@ -13,17 +15,25 @@ Usage:
     python main.py --provider anthropic         # real Anthropic (requires key)
     python main.py --calls 10                   # run more calls
     python main.py --show-calls                 # print every individual call
+    python main.py --calls 1000 --no-sleep      # skip simulated latency waits
+    python main.py --provider openai --calls 50 --parallelism 4   # cap in-flight calls
+    python main.py --semantic-cache cache.json  # reuse answers for paraphrases
 """
 
+import asyncio
+import functools
+import os
 import time
 import random
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, NamedTuple
 
 import click
 
 from dd_llm import (
-    LLMAdapter, LLMResponse,
+    LLMAdapter, LLMResponse, SemanticCache, SemanticCacheAdapter,
     register_adapter, get_adapter, list_adapters,
 )
 
@@ -32,25 +42,72 @@ from dd_llm import (
 # Configurable mock adapters with realistic cost profiles
 # ---------------------------------------------------------------------------
 
+class CostProfile(NamedTuple):
+    """Price per 1 M tokens."""
+    input:  float
+    output: float
+
+
 # Approximate real-world rates ($ per 1 M tokens)
-_COST_PROFILES: dict[str, dict[str, float]] = {
-    "mock-fast":     {"input": 0.10,  "output": 0.30},   # e.g. GPT-4o-mini tier
-    "mock-balanced": {"input": 2.50,  "output": 10.00},  # e.g. GPT-4o tier
-    "mock-premium":  {"input": 15.00, "output": 75.00},  # e.g. Claude-3-Opus tier
+_COST_PROFILES: dict[str, CostProfile] = {
+    "mock-fast":     CostProfile(input=0.10,  output=0.30),   # e.g. GPT-4o-mini tier
+    "mock-balanced": CostProfile(input=2.50,  output=10.00),  # e.g. GPT-4o tier
+    "mock-premium":  CostProfile(input=15.00, output=75.00),  # e.g. Claude-3-Opus tier
+}
+
+# Typical latency per profile (ms): premium models are slower
+_LATENCY_BASE_MS: dict[str, float] = {
+    "mock-fast": 80, "mock-balanced": 300, "mock-premium": 800,
 }
 
 
+# One bound RNG draw per simulated value; randint/uniform add several Python
+# calls each (range checks, getrandbits loops) on this hot path.
+_rand = random.random
+
+
+@functools.lru_cache(maxsize=1024)
+def _word_count(text: str) -> int:
+    # Demo prompts repeat (calls cycle through _PROMPTS): split each only once
+    return len(text.split())
+
+
 class MockCostAdapter(LLMAdapter):
-    """Simulates an LLM call with configurable latency, tokens, and cost."""
+    """Simulates an LLM call with configurable latency, tokens, and cost.
+
+    The reported ``latency_ms`` is the simulated value.  Set ``SLEEP = False``
+    (``--no-sleep``) to skip actually waiting for it, e.g. when benchmarking
+    the tracker itself.
+    """
+
+    SLEEP = True
 
     def __init__(self, profile: str = "mock-balanced"):
         self.profile = profile
         self._rates = _COST_PROFILES.get(profile, _COST_PROFILES["mock-balanced"])
+        # Per-token prices and base latency are fixed per profile: resolve once
+        self._in_per_tok  = self._rates.input  / 1_000_000
+        self._out_per_tok = self._rates.output / 1_000_000
+        self._latency_base = _LATENCY_BASE_MS.get(profile, 300)
 
     def call(self, prompt="", *, model="", messages=None, system=None,
              max_tokens=4096, temperature=0.7, **kwargs):
-        start = self._measure_time()
-
+        result = self._simulate(prompt, messages)
+        if self.SLEEP:
+            time.sleep(result.latency_ms / 1000)  # actually pause so latency is realistic
+        return result
+
+    def batch_call(self, prompts, **kwargs):
+        """Simulate a server-side batch: one round trip answers all *prompts*."""
+        results = [self._simulate(p) for p in prompts]
+        batch_latency = max((r.latency_ms for r in results), default=0.0)
+        if self.SLEEP:
+            time.sleep(batch_latency / 1000)
+        for r in results:
+            r.latency_ms = batch_latency
+        return results
+
+    def _simulate(self, prompt: str, messages: list[dict] | None = None) -> LLMResponse:
         history = messages or [{"role": "user", "content": prompt}]
         last_user = next(
             (m["content"] for m in reversed(history) if m["role"] == "user"),
@@ -58,19 +115,14 @@ class MockCostAdapter(LLMAdapter):
         )
 
         # Simulate variable token usage based on prompt length
-        base_in = max(10, len(last_user.split()))
-        input_tokens  = base_in + random.randint(5, 30)
-        output_tokens = random.randint(20, 120)
+        base_in = max(10, _word_count(last_user))
+        input_tokens  = base_in + 5 + int(_rand() * 26)   # + randint(5, 30)
+        output_tokens = 20 + int(_rand() * 101)           # randint(20, 120)
 
         # Simulate latency: premium models are slower
-        latency_base = {"mock-fast": 80, "mock-balanced": 300, "mock-premium": 800}
-        latency_ms = latency_base.get(self.profile, 300) + random.uniform(-50, 100)
-        time.sleep(latency_ms / 1000)  # actually pause so latency is realistic
+        latency_ms = self._latency_base - 50 + _rand() * 150  # + uniform(-50, 100)
 
-        cost_usd = (
-            input_tokens  * self._rates["input"]  / 1_000_000
-            + output_tokens * self._rates["output"] / 1_000_000
-        )
+        cost_usd = input_tokens * self._in_per_tok + output_tokens * self._out_per_tok
 
         reply = f"[{self.profile}] Response to: {last_user[:40]!r}"
 
@@ -81,7 +133,7 @@ class MockCostAdapter(LLMAdapter):
             model=self.profile,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
-            latency_ms=self._elapsed_ms(start),
+            latency_ms=latency_ms,
             cost_usd=cost_usd,
         )
 
@@ -96,7 +148,7 @@ register_adapter("mock", lambda: MockCostAdapter("mock-balanced"))
 # Cost tracker
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(slots=True)
 class CallRecord:
     """Metadata for a single LLM call."""
     provider:      str
@@ -109,118 +161,170 @@ class CallRecord:
     success:       bool
 
 
-@dataclass
-class CostTracker:
-    """Accumulate and report token usage and cost across LLM calls."""
+_CALL_LOG_ROW = "  {:<4} {:<18} {:>6} {:>6} {:>7.0f} ${:>9.6f}  {!r}{}"
+
 
-    records: list[CallRecord] = field(default_factory=list)
+@dataclass(slots=True)
+class CostTracker:
+    """Accumulate and report token usage and cost across LLM calls.
+
+    Metrics are stored column-wise (struct-of-arrays): each numeric field is a
+    typed ``array.array`` and provider names are interned to small integer
+    ids, so aggregates are C-level ``sum()`` calls over packed buffers instead
+    of attribute lookups on one object per call.  ``records`` rebuilds
+    ``CallRecord`` rows on demand.
+    """
+
+    providers:       list[str]   = field(default_factory=list)   # id -> name
+    provider_ids:    array       = field(default_factory=lambda: array("H"))
+    models:          list[str]   = field(default_factory=list)
+    prompt_snippets: list[str]   = field(default_factory=list)
+    input_tokens:    array       = field(default_factory=lambda: array("q"))
+    output_tokens:   array       = field(default_factory=lambda: array("q"))
+    cache_read_tokens:  array    = field(default_factory=lambda: array("q"))
+    cache_write_tokens: array    = field(default_factory=lambda: array("q"))
+    latency_ms:      array       = field(default_factory=lambda: array("d"))
+    cost_usd:        array       = field(default_factory=lambda: array("d"))
+    success:         array       = field(default_factory=lambda: array("b"))
+    _provider_index: dict[str, int] = field(default_factory=dict, repr=False)
 
     def record(self, result: LLMResponse, prompt_snippet: str = ""):
-        self.records.append(CallRecord(
-            provider=result.provider,
-            model=result.model,
-            prompt_snippet=prompt_snippet[:60],
-            input_tokens=result.input_tokens,
-            output_tokens=result.output_tokens,
-            latency_ms=result.latency_ms,
-            cost_usd=result.cost_usd or 0.0,
-            success=result.success,
-        ))
+        pid = self._provider_index.get(result.provider)
+        if pid is None:
+            pid = self._provider_index[result.provider] = len(self.providers)
+            self.providers.append(sys.intern(result.provider))
+        self.provider_ids.append(pid)
+        self.models.append(sys.intern(result.model))  # one str per distinct model
+        self.prompt_snippets.append(prompt_snippet[:60])
+        self.input_tokens.append(result.input_tokens)
+        self.output_tokens.append(result.output_tokens)
+        self.cache_read_tokens.append(result.cache_read_input_tokens)
+        self.cache_write_tokens.append(result.cache_creation_input_tokens)
+        self.latency_ms.append(result.latency_ms)
+        self.cost_usd.append(result.cost_usd or 0.0)
+        self.success.append(result.success)
+
+    @property
+    def records(self) -> list[CallRecord]:
+        """Row view of the stored calls."""
+        return [
+            CallRecord(self.providers[pid], model, snippet, tin, tout, lat, cost, bool(ok))
+            for pid, model, snippet, tin, tout, lat, cost, ok in zip(
+                self.provider_ids, self.models, self.prompt_snippets,
+                self.input_tokens, self.output_tokens,
+                self.latency_ms, self.cost_usd, self.success,
+            )
+        ]
 
     # -- aggregate stats -------------------------------------------------------
 
     def total_calls(self) -> int:
-        return len(self.records)
+        return len(self.provider_ids)
 
     def successful_calls(self) -> int:
-        return sum(1 for r in self.records if r.success)
+        return sum(self.success)
 
     def total_input_tokens(self) -> int:
-        return sum(r.input_tokens for r in self.records)
+        return sum(self.input_tokens)
 
     def total_output_tokens(self) -> int:
-        return sum(r.output_tokens for r in self.records)
+        return sum(self.output_tokens)
 
     def total_tokens(self) -> int:
         return self.total_input_tokens() + self.total_output_tokens()
 
     def total_cost_usd(self) -> float:
-        return sum(r.cost_usd for r in self.records)
+        return sum(self.cost_usd)
 
     def avg_latency_ms(self) -> float:
-        if not self.records:
+        if not self.latency_ms:
             return 0.0
-        return sum(r.latency_ms for r in self.records) / len(self.records)
+        return sum(self.latency_ms) / len(self.latency_ms)
 
     def by_provider(self) -> dict[str, dict[str, Any]]:
-        """Per-provider aggregates."""
-        agg: dict[str, dict[str, Any]] = {}
-        for rec in self.records:
-            if rec.provider not in agg:
-                agg[rec.provider] = {
-                    "calls": 0, "successes": 0,
-                    "input_tokens": 0, "output_tokens": 0,
-                    "cost_usd": 0.0, "total_latency_ms": 0.0,
-                }
-            a = agg[rec.provider]
-            a["calls"]          += 1
-            a["successes"]      += int(rec.success)
-            a["input_tokens"]   += rec.input_tokens
-            a["output_tokens"]  += rec.output_tokens
-            a["cost_usd"]       += rec.cost_usd
-            a["total_latency_ms"] += rec.latency_ms
-
-        # Derive averages
-        for name, a in agg.items():
-            a["avg_latency_ms"] = a["total_latency_ms"] / max(a["calls"], 1)
-            a["success_rate"]   = a["successes"] / max(a["calls"], 1)
-            del a["total_latency_ms"], a["successes"]
-
-        return agg
+        """Per-provider aggregates, accumulated in a single pass over the columns."""
+        n = len(self.providers)
+        calls, successes = [0] * n, [0] * n
+        tok_in, tok_out = [0] * n, [0] * n
+        cost, latency = [0.0] * n, [0.0] * n
+        for pid, ok, tin, tout, c, lat in zip(
+            self.provider_ids, self.success, self.input_tokens,
+            self.output_tokens, self.cost_usd, self.latency_ms,
+        ):
+            calls[pid]     += 1
+            successes[pid] += ok
+            tok_in[pid]    += tin
+            tok_out[pid]   += tout
+            cost[pid]      += c
+            latency[pid]   += lat
+
+        return {
+            name: {
+                "calls":          calls[pid],
+                "input_tokens":   tok_in[pid],
+                "output_tokens":  tok_out[pid],
+                "cost_usd":       cost[pid],
+                "avg_latency_ms": latency[pid] / max(calls[pid], 1),
+                "success_rate":   successes[pid] / max(calls[pid], 1),
+            }
+            for pid, name in enumerate(self.providers)
+        }
 
     def print_summary(self):
         """Print a formatted summary report."""
         width = 60
-        print(f"\n{'═' * width}")
-        print(f"  COST & USAGE SUMMARY")
-        print(f"{'═' * width}")
-        print(f"  Total calls       : {self.total_calls()}"
-              f" ({self.successful_calls()} succeeded)")
-        print(f"  Input tokens      : {self.total_input_tokens():,}")
-        print(f"  Output tokens     : {self.total_output_tokens():,}")
-        print(f"  Total tokens      : {self.total_tokens():,}")
-        print(f"  Total cost        : ${self.total_cost_usd():.6f}")
-        print(f"  Avg latency       : {self.avg_latency_ms():.0f} ms")
-
-        if len(self.by_provider()) > 1:
-            print(f"\n{'─' * width}")
-            print(f"  BY PROVIDER")
-            print(f"{'─' * width}")
-            for prov, a in sorted(self.by_provider().items()):
-                print(f"\n  [{prov}]")
-                print(f"    calls        : {a['calls']}"
-                      f"  (success rate {a['success_rate']:.0%})")
-                print(f"    tokens       : {a['input_tokens']:,} in"
-                      f" / {a['output_tokens']:,} out")
-                print(f"    cost         : ${a['cost_usd']:.6f}")
-                print(f"    avg latency  : {a['avg_latency_ms']:.0f} ms")
-
-        print(f"{'═' * width}\n")
+        lines = [
+            f"\n{'═' * width}",
+            f"  COST & USAGE SUMMARY",
+            f"{'═' * width}",
+            f"  Total calls       : {self.total_calls()}"
+            f" ({self.successful_calls()} succeeded)",
+            f"  Input tokens      : {self.total_input_tokens():,}",
+            f"  Output tokens     : {self.total_output_tokens():,}",
+            f"  Total tokens      : {self.total_tokens():,}",
+            f"  Total cost        : ${self.total_cost_usd():.6f}",
+            f"  Avg latency       : {self.avg_latency_ms():.0f} ms",
+        ]
+        cache_read, cache_write = sum(self.cache_read_tokens), sum(self.cache_write_tokens)
+        if cache_read or cache_write:
+            lines.append(f"  Prompt cache      : {cache_read:,} read"
+                         f" / {cache_write:,} written")
+
+        providers = self.by_provider()
+        if len(providers) > 1:
+            lines += [f"\n{'─' * width}", f"  BY PROVIDER", f"{'─' * width}"]
+            for prov, a in sorted(providers.items()):
+                lines += [
+                    f"\n  [{prov}]",
+                    f"    calls        : {a['calls']}"
+                    f"  (success rate {a['success_rate']:.0%})",
+                    f"    tokens       : {a['input_tokens']:,} in"
+                    f" / {a['output_tokens']:,} out",
+                    f"    cost         : ${a['cost_usd']:.6f}",
+                    f"    avg latency  : {a['avg_latency_ms']:.0f} ms",
+                ]
+
+        lines.append(f"{'═' * width}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
 
     def print_call_log(self):
-        """Print every individual call record."""
-        print(f"\n{'─' * 80}")
-        print(f"  CALL LOG ({len(self.records)} records)")
-        print(f"{'─' * 80}")
-        print(f"  {'#':<4} {'provider':<18} {'in':>6} {'out':>6}"
-              f" {'ms':>7} {'cost':>10}  prompt")
-        print(f"  {'─'*4} {'─'*18} {'─'*6} {'─'*6} {'─'*7} {'─'*10}  {'─'*30}")
-        for i, r in enumerate(self.records, 1):
-            status = "" if r.success else " FAIL"
-            print(f"  {i:<4} {r.provider:<18} {r.input_tokens:>6}"
-                  f" {r.output_tokens:>6} {r.latency_ms:>7.0f}"
-                  f" ${r.cost_usd:>9.6f}  {r.prompt_snippet!r}{status}")
-        print()
+        """Print every individual call record (built up and written in one go)."""
+        lines = [
+            f"\n{'─' * 80}",
+            f"  CALL LOG ({self.total_calls()} records)",
+            f"{'─' * 80}",
+            f"  {'#':<4} {'provider':<18} {'in':>6} {'out':>6}"
+            f" {'ms':>7} {'cost':>10}  prompt",
+            f"  {'─'*4} {'─'*18} {'─'*6} {'─'*6} {'─'*7} {'─'*10}  {'─'*30}",
+        ]
+        fmt = _CALL_LOG_ROW.format
+        lines.extend(
+            fmt(i, r.provider, r.input_tokens, r.output_tokens, r.latency_ms,
+                r.cost_usd, r.prompt_snippet, "" if r.success else " FAIL")
+            for i, r in enumerate(self.records, 1)
+        )
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ---------------------------------------------------------------------------
@@ -241,6 +345,38 @@ _PROMPTS = [
 ]
 
 
+async def _run_calls(
+    plan: list[tuple[str, str]],
+    model: str,
+    cache: SemanticCache | None = None,
+    parallelism: int | None = None,
+) -> list[LLMResponse]:
+    """Send each provider its prompts as one batch, all providers concurrently.
+
+    *parallelism* caps in-flight requests per provider so large runs stay
+    within rate limits.  Results are returned in plan order.
+    """
+    positions: dict[str, list[int]] = {}
+    for i, (prov, _) in enumerate(plan):
+        positions.setdefault(prov, []).append(i)
+
+    async def run_batch(prov: str) -> list[LLMResponse]:
+        adapter = get_adapter(prov)
+        if cache is not None:
+            adapter = SemanticCacheAdapter(adapter, cache)
+        prompts = [plan[i][1] for i in positions[prov]]
+        return await asyncio.to_thread(
+            adapter.batch_call, prompts, model=model, max_concurrency=parallelism
+        )
+
+    batches = await asyncio.gather(*(run_batch(prov) for prov in positions))
+    results: list[LLMResponse] = [None] * len(plan)  # type: ignore[list-item]
+    for prov, batch in zip(positions, batches):
+        for i, result in zip(positions[prov], batch):
+            results[i] = result
+    return results
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -254,9 +390,19 @@ _PROMPTS = [
               help="Spread calls across all three mock-* cost profiles")
 @click.option("--show-calls",  is_flag=True,
               help="Print per-call log after the summary")
-def main(provider, model, calls, multi, show_calls):
+@click.option("--semantic-cache", "semantic_cache", default=None, metavar="PATH",
+              help="Serve paraphrased prompts from a semantic cache persisted at PATH "
+                   "(needs dd-llm[semcache])")
+@click.option("--no-sleep",    is_flag=True,
+              help="Mock adapters report simulated latency without waiting for it")
+@click.option("--parallelism", default=8, show_default=True,
+              help="Max concurrent requests per provider (0 = unbounded)")
+def main(provider, model, calls, multi, show_calls, semantic_cache, no_sleep,
+         parallelism):
     """Cost tracking: aggregate token usage and cost across LLM calls."""
 
+    MockCostAdapter.SLEEP = not no_sleep
+
     print(f"Available providers: {list_adapters()}")
 
     tracker = CostTracker()
@@ -265,21 +411,33 @@ def main(provider, model, calls, multi, show_calls):
         # Round-robin across fast / balanced / premium mocks
         profiles = ["mock-fast", "mock-balanced", "mock-premium"]
         print(f"Multi-provider mode: {profiles}\n")
-        for i in range(calls):
-            prov   = profiles[i % len(profiles)]
-            prompt = _PROMPTS[i % len(_PROMPTS)]
+        plan = [
+            (profiles[i % len(profiles)], _PROMPTS[i % len(_PROMPTS)])
+            for i in range(calls)
+        ]
+        for i, (prov, prompt) in enumerate(plan):
             print(f"  Call {i+1}/{calls}  [{prov}]  {prompt[:50]!r}")
-            adapter = get_adapter(prov)
-            result  = adapter.call(prompt=prompt, model=model)
-            tracker.record(result, prompt_snippet=prompt)
     else:
         print(f"Using provider: {provider}\n")
-        adapter = get_adapter(provider)
-        for i in range(calls):
-            prompt = _PROMPTS[i % len(_PROMPTS)]
+        plan = [(provider, _PROMPTS[i % len(_PROMPTS)]) for i in range(calls)]
+        for i, (_, prompt) in enumerate(plan):
             print(f"  Call {i+1}/{calls}  {prompt[:50]!r}")
-            result = adapter.call(prompt=prompt, model=model)
-            tracker.record(result, prompt_snippet=prompt)
+
+    cache = None
+    if semantic_cache:
+        cache = SemanticCache()
+        if os.path.exists(semantic_cache):
+            cache.load(semantic_cache)
+            print(f"\nLoaded {len(cache)} semantic cache entries from {semantic_cache}")
+
+    # All calls are independent and I/O-bound, so overlap them
+    results = asyncio.run(_run_calls(plan, model, cache, parallelism or None))
+
+    if cache is not None:
+        cache.save(semantic_cache)
+        print(f"Semantic cache: {cache.hits} hits / {cache.misses} misses")
+    for (_, prompt), result in zip(plan, results):
+        tracker.record(result, prompt_snippet=prompt)
 
     if show_calls:
         tracker.print_call_log()
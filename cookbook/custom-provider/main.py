@@ -10,6 +10,7 @@ Usage:
     python main.py --provider uppercase    # Use the custom uppercase provider
 """
 
+import functools
 import time
 import click
 from dd_llm import (
@@ -18,6 +19,11 @@ from dd_llm import (
 )
 
 
+@functools.lru_cache(maxsize=1024)
+def _word_count(text: str) -> int:
+    return len(text.split())
+
+
 # ---------------------------------------------------------------------------
 # Custom adapter 1: Echo (returns the prompt back)
 # ---------------------------------------------------------------------------
@@ -34,13 +40,14 @@ class EchoAdapter(LLMAdapter):
         else:
             text = prompt
 
+        words = _word_count(text)
         return LLMResponse(
             content=f"[echo] {text}",
             success=True,
             provider="echo",
             model="echo-v1",
-            input_tokens=len(text.split()),
-            output_tokens=len(text.split()),
+            input_tokens=words,
+            output_tokens=words,
             latency_ms=self._elapsed_ms(start),
             cost_usd=0.0,
         )
@@ -67,13 +74,14 @@ class UppercaseAdapter(LLMAdapter):
         else:
             text = prompt
 
+        words = _word_count(text)
         return LLMResponse(
             content=text.upper(),
             success=True,
             provider="uppercase",
             model="upper-v1",
-            input_tokens=len(text.split()),
-            output_tokens=len(text.split()),
+            input_tokens=words,
+            output_tokens=words,
             latency_ms=self._elapsed_ms(start),
             cost_usd=0.0,
         )
@@ -5,6 +5,8 @@ Demonstrates:
 - Passing the full history on every call via the messages= parameter
 - Adding system prompt to set persona / tone
 - Inspecting per-turn token usage from LLMResponse
+- Marking the stable history prefix with cache_control for provider prompt caching
+- Bounding context growth with a sliding window (+ optional running summary)
 - Running without a real API key using the built-in mock EchoAdapter
 
 Usage:
@@ -13,8 +15,10 @@ Usage:
     python main.py --provider anthropic         # real Anthropic
     python main.py --provider ollama            # local Ollama
     python main.py --interactive --provider openai   # type your own messages
+    python main.py --max-turns 2 --summarize    # send only 2 turns + a summary
 """
 
+import functools
 import time
 import click
 
@@ -28,6 +32,12 @@ from dd_llm import (
 # Mock adapter — works without any API key, useful for demo / testing
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=1024)
+def _word_count(text: str) -> int:
+    # History is re-sent every turn: count each message's words only once
+    return len(text.split())
+
+
 class MockChatAdapter(LLMAdapter):
     """Returns a canned reply that references the last user message.
     Useful for demo / CI without a real API key.
@@ -37,11 +47,17 @@ class MockChatAdapter(LLMAdapter):
              max_tokens=4096, temperature=0.7, **kwargs):
         start = self._measure_time()
         history = messages or [{"role": "user", "content": prompt}]
-        last_user = next(
-            (m["content"] for m in reversed(history) if m["role"] == "user"),
-            prompt,
-        )
-        turn = sum(1 for m in history if m["role"] == "assistant") + 1
+
+        # One pass over the history for last user message, turn and token count
+        last_user, turn, input_tokens = prompt, 1, 0
+        for m in history:
+            role = m["role"]
+            if role == "user":
+                last_user = m["content"]
+            elif role == "assistant":
+                turn += 1
+            input_tokens += _word_count(m["content"])
+
         reply = (
             f"[mock turn {turn}] You said: '{last_user[:60]}'. "
             f"History has {len(history)} messages."
@@ -51,7 +67,7 @@ class MockChatAdapter(LLMAdapter):
             success=True,
             provider="mock",
             model="mock-chat-v1",
-            input_tokens=sum(len(m["content"].split()) for m in history),
+            input_tokens=input_tokens,
             output_tokens=len(reply.split()),
             latency_ms=self._elapsed_ms(start),
             cost_usd=0.0,
@@ -65,16 +81,40 @@ register_adapter("mock", MockChatAdapter)
 # Chat session helper
 # ---------------------------------------------------------------------------
 
+_CACHE_CONTROL = {"type": "ephemeral"}
+
+
 class ChatSession:
-    """Maintains conversation history and calls the LLM on each turn."""
+    """Maintains conversation history and calls the LLM on each turn.
+
+    Only the system prompt and the last ``max_turns`` turns are sent, so the
+    per-turn cost stays bounded instead of growing with the conversation
+    (``None`` sends everything).  With ``summarize`` the turns that slide out
+    of the window are folded into a running summary by a (cheap)
+    ``summary_model`` and sent as an extra system message.
+
+    With ``enable_prompt_cache`` the system prompt and the last message before
+    the new user turn are tagged with ``cache_control`` so providers with
+    explicit prompt caching (Anthropic) reuse the already-processed prefix
+    instead of re-reading the whole history every turn.
+    """
 
-    def __init__(self, provider: str, system: str = "", model: str = ""):
+    def __init__(self, provider: str, system: str = "", model: str = "",
+                 enable_prompt_cache: bool = True, max_turns: int | None = 10,
+                 summarize: bool = False, summary_model: str = ""):
         self.adapter = get_adapter(provider)
         self.model = model
+        self.enable_prompt_cache = enable_prompt_cache
+        self.max_turns = max_turns
+        self.summarize = summarize
+        self.summary_model = summary_model
         self.history: list[dict] = []
         self.total_input_tokens = 0
         self.total_output_tokens = 0
+        self.total_cache_read_tokens = 0
         self.total_cost = 0.0
+        self._summary = ""
+        self._summarized = 0  # number of pruned messages already in the summary
 
         if system:
             self.history.append({"role": "system", "content": system})
@@ -84,24 +124,72 @@ class ChatSession:
         self.history.append({"role": "user", "content": user_message})
 
         result = self.adapter.call(
-            messages=self.history,
+            messages=self._request_messages(),
             model=self.model,
         )
 
         if result.success:
             self.history.append({"role": "assistant", "content": result.content})
-            self.total_input_tokens += result.input_tokens
-            self.total_output_tokens += result.output_tokens
-            self.total_cost += result.cost_usd or 0.0
+            self._track(result)
 
         return result
 
+    def _track(self, result: LLMResponse):
+        self.total_input_tokens += result.input_tokens
+        self.total_output_tokens += result.output_tokens
+        self.total_cache_read_tokens += result.cache_read_input_tokens
+        self.total_cost += result.cost_usd or 0.0
+
+    def _request_messages(self) -> list[dict]:
+        """System prompt, running summary and recent turns, with cache breakpoints."""
+        system = [m for m in self.history if m["role"] == "system"]
+        convo = [m for m in self.history if m["role"] != "system"]
+
+        if self.max_turns:
+            keep = 2 * self.max_turns - 1  # window starts on a user message
+            pruned, convo = convo[:-keep], convo[-keep:]
+            if self.summarize and len(pruned) > self._summarized:
+                self._update_summary(pruned[self._summarized:])
+                self._summarized = len(pruned)
+        if self._summary:
+            system.append({
+                "role": "system",
+                "content": f"Summary of the earlier conversation: {self._summary}",
+            })
+
+        messages = system + convo
+        if self.enable_prompt_cache:
+            breakpoints = {len(messages) - 2}  # last message before the new turn
+            if system:
+                breakpoints.add(0)
+            for i in breakpoints:
+                if i >= 0:
+                    messages[i] = {**messages[i], "cache_control": _CACHE_CONTROL}
+        return messages
+
+    def _update_summary(self, dropped: list[dict]):
+        """Fold turns leaving the window into the running summary."""
+        transcript = "\n".join(f"{m['role']}: {m['content']}" for m in dropped)
+        result = self.adapter.call(
+            prompt=(
+                "Update the running summary of a conversation with the new turns "
+                "below. Reply with the summary only, in at most five sentences.\n\n"
+                f"Current summary: {self._summary or '(none)'}\n\n"
+                f"New turns:\n{transcript}"
+            ),
+            model=self.summary_model or self.model,
+        )
+        if result.success:
+            self._summary = result.content.strip()
+            self._track(result)
+
     def summary(self) -> dict:
         return {
             "turns": sum(1 for m in self.history if m["role"] == "user"),
             "total_messages": len(self.history),
             "total_input_tokens": self.total_input_tokens,
             "total_output_tokens": self.total_output_tokens,
+            "total_cache_read_tokens": self.total_cache_read_tokens,
             "total_cost_usd": round(self.total_cost, 6),
         }
 
@@ -114,7 +202,15 @@ class ChatSession:
 @click.option("--provider", default="mock", help="LLM provider name")
 @click.option("--model", default="", help="Model override")
 @click.option("--interactive", is_flag=True, help="Enter interactive chat mode")
-def main(provider, model, interactive):
+@click.option("--no-prompt-cache", is_flag=True,
+              help="Do not mark the history prefix with cache_control")
+@click.option("--max-turns", default=10, show_default=True,
+              help="Turns of history sent per call (0 = all)")
+@click.option("--summarize", is_flag=True,
+              help="Summarize turns that fall out of the --max-turns window")
+@click.option("--summary-model", default="", help="Model used for summaries")
+def main(provider, model, interactive, no_prompt_cache, max_turns, summarize,
+         summary_model):
     """Multi-turn chat with persistent message history."""
 
     print(f"Available providers: {list_adapters()}")
@@ -134,7 +230,10 @@ def main(provider, model, interactive):
         print(f"System: {system_prompt}")
         print()
 
-        session = ChatSession(provider=provider, system=system_prompt, model=model)
+        session = ChatSession(provider=provider, system=system_prompt, model=model,
+                          enable_prompt_cache=not no_prompt_cache,
+                          max_turns=max_turns or None, summarize=summarize,
+                          summary_model=summary_model)
 
         turns = [
             "What is a large language model?",
@@ -173,7 +272,10 @@ def main(provider, model, interactive):
     print(f"System: {system_prompt}")
     print("Type your message and press Enter. Ctrl-C or 'quit' to exit.\n")
 
-    session = ChatSession(provider=provider, system=system_prompt, model=model)
+    session = ChatSession(provider=provider, system=system_prompt, model=model,
+                          enable_prompt_cache=not no_prompt_cache,
+                          max_turns=max_turns or None, summarize=summarize,
+                          summary_model=summary_model)
 
     while True:
         try:
@@ -4,15 +4,18 @@ Demonstrates UnifiedLLMProvider's self-healing behavior:
 1. Try the primary provider with retries (exponential backoff + jitter)
 2. On exhaustion, fall back to the next provider in the chain
 3. On retries, inject error context so the LLM can self-correct
+4. Optionally hedge: start the next provider if the current one is slow
 
 Usage:
     python main.py
     python main.py --primary ollama --fallback openai --fallback anthropic
     python main.py --retries 2 --initial-wait 0.5
+    python main.py --hedge-delay 0.5            # race fallback after 0.5s
 """
 
+import asyncio
+
 import click
-from dd_llm import UnifiedLLMProvider
 
 
 @click.command()
@@ -20,8 +23,12 @@ from dd_llm import UnifiedLLMProvider
 @click.option("--fallback", multiple=True, default=["anthropic", "ollama"], help="Fallback providers (repeatable)")
 @click.option("--retries", default=3, help="Max retries per provider")
 @click.option("--initial-wait", default=1.0, help="Initial backoff seconds")
-def main(primary, fallback, retries, initial_wait):
+@click.option("--hedge-delay", default=None, type=float,
+              help="Start the next provider if no success after this many seconds")
+def main(primary, fallback, retries, initial_wait, hedge_delay):
     """Demonstrate retry + fallback across multiple LLM providers."""
+    # Imported here so `--help` does not pay for loading dd-llm
+    from dd_llm import UnifiedLLMProvider
 
     provider = UnifiedLLMProvider(
         primary_provider=primary,
@@ -36,10 +43,15 @@ def main(primary, fallback, retries, initial_wait):
     print(f"Fallback:  {list(fallback)}")
     print(f"Retries:   {retries} per provider")
     print(f"Backoff:   {initial_wait}s initial")
+    if hedge_delay is not None:
+        print(f"Hedge:     next provider after {hedge_delay}s")
     print()
 
     # Make the call — retries and fallback happen automatically
-    result = provider.call(prompt)
+    if hedge_delay is None:
+        result = provider.call(prompt)
+    else:
+        result = asyncio.run(provider.acall_hedged(prompt, hedge_delay=hedge_delay))
 
     if result.success:
         print(f"Provider:  {result.provider}")
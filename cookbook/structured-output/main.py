@@ -2,9 +2,10 @@
 
 Demonstrates:
 - Using a system prompt to instruct the LLM to reply in JSON
-- Parsing the response with json.loads()
-- Validating extracted fields with a simple dataclass
+- Parsing the response with json.loads() (orjson when installed)
+- Validating extracted fields against a per-task schema (msgspec, when installed)
 - Graceful fallback when the LLM returns malformed JSON
+- Running independent tasks concurrently with acall() + asyncio.gather
 - Running without a real API key using a built-in mock adapter
 
 Usage:
@@ -15,15 +16,28 @@ Usage:
     python main.py --task sentiment             # run sentiment task
     python main.py --task entity                # run entity extraction task
     python main.py --task summary               # run structured summary task
+    python main.py --cache cache.sqlite         # rerun instantly from a disk cache
+    python main.py --concurrency 1              # one task at a time (rate limits)
 """
 
+import asyncio
 import json
+import re
 import click
-from dataclasses import dataclass
 from typing import Any
 
+try:  # orjson parses LLM output several times faster; stdlib json otherwise
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 from dd_llm import (
-    LLMAdapter, LLMResponse,
+    CachingAdapter, DiskCache, LLMAdapter, LLMResponse,
     register_adapter, get_adapter, list_adapters,
 )
 
@@ -35,33 +49,32 @@ from dd_llm import (
 # Keys are unique substrings searched in the user prompt (most-specific first).
 # "key_points" is unique to the summary task; "entity" is unique to the entity task;
 # "confidence" is unique to the sentiment task.
+# Payloads are stored already serialised (exactly what json.dumps produces)
+# so importing the demo does no JSON work.
 _MOCK_RESPONSES = [
-    ("key_points", json.dumps({
-        "title": "Quarterly Earnings Beat",
-        "key_points": [
-            "Revenue up 12% YoY",
-            "iPhone sales exceeded expectations",
-            "Services segment hit all-time high",
-        ],
-        "sentiment": "positive",
-        "word_count": 42,
-    })),
-    ("entity_count", json.dumps({
-        "entities": [
-            {"text": "Apple Inc.", "type": "ORG"},
-            {"text": "Tim Cook",   "type": "PERSON"},
-            {"text": "Cupertino",  "type": "LOC"},
-        ],
-        "entity_count": 3,
-    })),
-    ("confidence", json.dumps({
-        "sentiment": "positive",
-        "confidence": 0.92,
-        "keywords": ["great", "love", "excellent"],
-    })),
+    ("key_points",
+     '{"title": "Quarterly Earnings Beat", '
+     '"key_points": ["Revenue up 12% YoY", "iPhone sales exceeded expectations", '
+     '"Services segment hit all-time high"], '
+     '"sentiment": "positive", "word_count": 42}'),
+    ("entity_count",
+     '{"entities": [{"text": "Apple Inc.", "type": "ORG"}, '
+     '{"text": "Tim Cook", "type": "PERSON"}, '
+     '{"text": "Cupertino", "type": "LOC"}], '
+     '"entity_count": 3}'),
+    ("confidence",
+     '{"sentiment": "positive", "confidence": 0.92, '
+     '"keywords": ["great", "love", "excellent"]}'),
 ]
 
-_DEFAULT_MOCK = json.dumps({"result": "ok", "note": "generic mock response"})
+_DEFAULT_MOCK = '{"result": "ok", "note": "generic mock response"}'
+
+# All keys in one case-insensitive pattern: a single scan of the prompt
+# instead of a .lower() copy plus one substring search per key.
+_MOCK_KEY_RE = re.compile(
+    "|".join(re.escape(key) for key, _ in _MOCK_RESPONSES), re.IGNORECASE
+)
+_MOCK_RANK = {key: i for i, (key, _) in enumerate(_MOCK_RESPONSES)}
 
 
 class MockStructuredAdapter(LLMAdapter):
@@ -71,24 +84,27 @@ class MockStructuredAdapter(LLMAdapter):
              max_tokens=4096, temperature=0.7, **kwargs):
         start = self._measure_time()
         history = messages or [{"role": "user", "content": prompt}]
-        last_user = next(
-            (m["content"] for m in reversed(history) if m["role"] == "user"),
-            prompt,
-        )
+
+        # One pass: rough word count (spaces + 1 per message) and last user turn
+        input_tokens = 0
+        last_user = prompt
+        for m in history:
+            content = m["content"]
+            input_tokens += content.count(" ") + 1
+            if m["role"] == "user":
+                last_user = content
 
         # Choose a mock payload based on unique keywords in the user message
-        reply = _DEFAULT_MOCK
-        for key, payload in _MOCK_RESPONSES:
-            if key in last_user.lower():
-                reply = payload
-                break
+        # (earlier list entries win when several keys occur)
+        ranks = [_MOCK_RANK[m.group().lower()] for m in _MOCK_KEY_RE.finditer(last_user)]
+        reply = _MOCK_RESPONSES[min(ranks)][1] if ranks else _DEFAULT_MOCK
 
         return LLMResponse(
             content=reply,
             success=True,
             provider="mock",
             model="mock-structured-v1",
-            input_tokens=sum(len(m["content"].split()) for m in history),
+            input_tokens=input_tokens,
             output_tokens=len(reply.split()),
             latency_ms=self._elapsed_ms(start),
             cost_usd=0.0,
@@ -98,6 +114,51 @@ class MockStructuredAdapter(LLMAdapter):
 register_adapter("mock", MockStructuredAdapter)
 
 
+# ---------------------------------------------------------------------------
+# Per-task output schemas
+# ---------------------------------------------------------------------------
+
+_DECODERS: dict[str, Any] = {}
+_PARSE_ERRORS: tuple[type[Exception], ...] = (json.JSONDecodeError,)
+
+if msgspec is not None:
+    class Sentiment(msgspec.Struct):
+        sentiment: str
+        confidence: float
+        keywords: list[str]
+
+    class Entity(msgspec.Struct):
+        text: str
+        type: str
+
+    class Entities(msgspec.Struct):
+        entities: list[Entity]
+        entity_count: int
+
+    class Summary(msgspec.Struct):
+        title: str
+        key_points: list[str]
+        sentiment: str
+        word_count: int
+
+    # One decoder per schema, built once: parses and validates in a single
+    # pass without an intermediate dict
+    _DECODERS = {
+        "sentiment": msgspec.json.Decoder(Sentiment),
+        "entity": msgspec.json.Decoder(Entities),
+        "summary": msgspec.json.Decoder(Summary),
+    }
+    _PARSE_ERRORS += (msgspec.DecodeError,)
+
+
+def parse_task_output(task_key: str, content: str) -> dict[str, Any]:
+    """Parse (and, with msgspec, validate) the JSON reply for *task_key*."""
+    decoder = _DECODERS.get(task_key)
+    if decoder is None:
+        return _loads(content)
+    return msgspec.to_builtins(decoder.decode(content))
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -107,30 +168,7 @@ SYSTEM_PROMPT = (
     "ALWAYS respond with valid JSON only — no markdown fences, no prose. "
     "Your entire response must be parseable by json.loads()."
 )
-
-
-def call_structured(adapter: LLMAdapter, user_prompt: str, model: str = "") -> dict[str, Any]:
-    """Call the LLM and parse the JSON response. Returns a dict (empty on error)."""
-    result = adapter.call(
-        messages=[
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user",   "content": user_prompt},
-        ],
-        model=model,
-    )
-
-    if not result.success:
-        last_err = (result.error_history or [{}])[-1].get("error", "unknown")
-        print(f"  [LLM ERROR] {last_err}")
-        return {}
-
-    try:
-        parsed = json.loads(result.content)
-        return parsed
-    except json.JSONDecodeError as exc:
-        print(f"  [JSON PARSE ERROR] {exc}")
-        print(f"  Raw content: {result.content[:200]}")
-        return {}
+_SYS_MSG = {"role": "system", "content": SYSTEM_PROMPT}  # shared, never mutated
 
 
 def print_result(label: str, data: dict[str, Any], result_meta: LLMResponse | None = None):
@@ -143,7 +181,8 @@ def print_result(label: str, data: dict[str, Any], result_meta: LLMResponse | No
         print("  (no structured data extracted)")
     if result_meta:
         print(f"  [{result_meta.input_tokens} in / {result_meta.output_tokens} out"
-              f" — {result_meta.latency_ms:.0f}ms]")
+              f" — {result_meta.latency_ms:.0f}ms"
+              f"{' — cached' if result_meta.cached else ''}]")
 
 
 # ---------------------------------------------------------------------------
@@ -185,6 +224,33 @@ TASKS = {
 }
 
 
+# Task prompts are fixed: render each conversation once and reuse it
+_TASK_MESSAGES = {
+    key: [_SYS_MSG, {"role": "user", "content": cfg["prompt"]}]
+    for key, cfg in TASKS.items()
+}
+
+
+async def run_tasks(
+    adapter: LLMAdapter,
+    tasks: list[tuple[str, dict[str, str]]],
+    model: str = "",
+    concurrency: int | None = None,
+) -> list[LLMResponse]:
+    """Send the tasks concurrently so their network round trips overlap.
+
+    At most *concurrency* calls are in flight (all at once when ``None``),
+    for providers that rate-limit.  Results are returned in *tasks* order.
+    """
+    limit = asyncio.Semaphore(concurrency or len(tasks) or 1)
+
+    async def one(key: str) -> LLMResponse:
+        async with limit:
+            return await adapter.acall(messages=_TASK_MESSAGES[key], model=model)
+
+    return await asyncio.gather(*(one(key) for key, _ in tasks))
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -198,7 +264,11 @@ TASKS = {
     type=click.Choice(["all", "sentiment", "entity", "summary"]),
     help="Which extraction task to run",
 )
-def main(provider, model, task):
+@click.option("--cache", "cache_path", default=None, metavar="PATH",
+              help="Reuse responses stored in this SQLite file across runs")
+@click.option("--concurrency", default=0, show_default=True,
+              help="Max tasks in flight at once (0 = all)")
+def main(provider, model, task, cache_path, concurrency):
     """Structured output: extract JSON from LLM responses."""
 
     print(f"Available providers: {list_adapters()}")
@@ -206,31 +276,31 @@ def main(provider, model, task):
     print(f"\nSystem prompt: {SYSTEM_PROMPT}\n")
 
     adapter = get_adapter(provider)
+    if cache_path:
+        # The task prompts are fixed, so reuse answers regardless of temperature
+        adapter = CachingAdapter(
+            adapter, DiskCache(cache_path), name=provider, max_temperature=float("inf")
+        )
 
     tasks_to_run = list(TASKS.items()) if task == "all" else [(task, TASKS[task])]
 
-    for task_key, task_cfg in tasks_to_run:
+    for _, task_cfg in tasks_to_run:
         print(f"\n>>> Running task: {task_cfg['label']}")
         print(f"Prompt: {task_cfg['prompt'][:120]}...")
 
-        # Make the raw call so we can access metadata
-        result = adapter.call(
-            messages=[
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user",   "content": task_cfg["prompt"]},
-            ],
-            model=model,
-        )
+    # Independent tasks: issue all calls concurrently, report in task order
+    results = asyncio.run(run_tasks(adapter, tasks_to_run, model, concurrency or None))
 
+    for (task_key, task_cfg), result in zip(tasks_to_run, results):
         if not result.success:
             last_err = (result.error_history or [{}])[-1].get("error", "unknown")
-            print(f"  [LLM ERROR] {last_err}")
+            print(f"  [LLM ERROR] {task_cfg['label']}: {last_err}")
             continue
 
         try:
-            parsed = json.loads(result.content)
+            parsed = parse_task_output(task_key, result.content)
             print_result(task_cfg["label"], parsed, result)
-        except json.JSONDecodeError as exc:
+        except _PARSE_ERRORS as exc:
             print(f"  [JSON PARSE ERROR] {exc}")
             print(f"  Raw response (first 300 chars): {result.content[:300]}")
 
@@ -5,17 +5,40 @@ Public API
 - ``LLMAdapter``          — Abstract base class for providers
 - ``LLMResponse``         — Structured response dataclass
 - ``UnifiedLLMProvider``  — Multi-provider client with retry + fallback
+- ``CachingAdapter``      — Exact-match response cache around any adapter
+- ``ResponseCache``       — In-process LRU store used by ``CachingAdapter``
+- ``DiskCache``           — SQLite-backed response store that survives restarts
+- ``SemanticCacheAdapter`` — Embedding-based cache for paraphrased prompts
+- ``SemanticCache``       — Embedding index used by ``SemanticCacheAdapter``
 - ``register_adapter``    — Register a custom provider
 - ``get_adapter``         — Get an adapter instance by name
 - ``list_adapters``       — List registered adapter names
+- ``is_registered``       — Check whether a provider name is registered
+- ``registered_names``    — Registered adapter names as a frozenset
 - ``call_llm``            — Simple convenience function (returns string)
 - ``get_llm_stats``       — Per-provider statistics
 """
 
+from __future__ import annotations
+
+import importlib
+import os
+from typing import TYPE_CHECKING
+
 from dd_llm.base import LLMAdapter, LLMResponse
-from dd_llm.registry import register_adapter, get_adapter, list_adapters
+from dd_llm.registry import (
+    register_adapter,
+    get_adapter,
+    list_adapters,
+    is_registered,
+    registered_names,
+)
 from dd_llm.provider import UnifiedLLMProvider
 
+if TYPE_CHECKING:
+    from dd_llm.cache import CachingAdapter, DiskCache, ResponseCache
+    from dd_llm.semcache import SemanticCache, SemanticCacheAdapter
+
 # Trigger auto-registration of built-in adapters
 import dd_llm._builtins  # noqa: F401
 
@@ -23,18 +46,49 @@ __all__ = [
     "LLMAdapter",
     "LLMResponse",
     "UnifiedLLMProvider",
+    "CachingAdapter",
+    "ResponseCache",
+    "DiskCache",
+    "SemanticCache",
+    "SemanticCacheAdapter",
     "register_adapter",
     "get_adapter",
     "list_adapters",
+    "is_registered",
+    "registered_names",
     "call_llm",
     "get_llm_stats",
 ]
 
+# Cache classes are imported on first attribute access (PEP 562), so
+# ``import dd_llm`` does not load sqlite3 / hashlib for callers that never cache.
+_LAZY = {
+    "CachingAdapter": "cache",
+    "ResponseCache": "cache",
+    "DiskCache": "cache",
+    "SemanticCache": "semcache",
+    "SemanticCacheAdapter": "semcache",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
 # ---------------------------------------------------------------------------
 # Convenience functions (lazy singleton)
 # ---------------------------------------------------------------------------
 
 _global_llm: UnifiedLLMProvider | None = None
+_global_cache: ResponseCache | DiskCache | None = None
 
 
 def _get_llm() -> UnifiedLLMProvider:
@@ -44,20 +98,41 @@ def _get_llm() -> UnifiedLLMProvider:
     return _global_llm
 
 
+def _get_cache() -> ResponseCache | DiskCache:
+    """Cache used by ``call_llm(cache=True)``: on disk if ``LLM_CACHE_PATH`` is set."""
+    global _global_cache
+    if _global_cache is None:
+        from dd_llm.cache import DiskCache, ResponseCache
+
+        path = os.environ.get("LLM_CACHE_PATH")
+        _global_cache = DiskCache(path) if path else ResponseCache()
+    return _global_cache
+
+
 def call_llm(
     prompt: str | None = None,
     *,
     messages: list[dict] | None = None,
     provider: str | None = None,
+    cache: bool = False,
     **kwargs,
 ) -> str:
     """Simple LLM call — returns the response text.
 
     Uses the global :class:`UnifiedLLMProvider` with self-healing retry.
     Pass either *prompt* (single string) or *messages* (conversation list).
-    Raises ``RuntimeError`` on failure.
+    With ``cache=True`` an identical earlier ``temperature=0`` request is
+    answered from the response cache (a :class:`DiskCache` at
+    ``$LLM_CACHE_PATH`` when set, otherwise in memory).  Raises
+    ``RuntimeError`` on failure.
     """
-    response = _get_llm().call(prompt, messages=messages, provider=provider, **kwargs)
+    response = _get_llm().call(
+        prompt,
+        messages=messages,
+        provider=provider,
+        cache=_get_cache() if cache else None,
+        **kwargs,
+    )
     if not response.success:
         errors = response.error_history or []
         last = errors[-1]["error"] if errors else "unknown error"
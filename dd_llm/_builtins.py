@@ -1,40 +1,60 @@
-"""Auto-register built-in adapters on import."""
+"""Auto-register built-in adapters on import.
+
+Adapter modules are imported by their factories on first ``get_adapter()``,
+so ``import dd_llm`` does not load code for providers that are never used.
+"""
 
 from __future__ import annotations
 
+import importlib
 import os
+from typing import Callable
 
+from dd_llm.base import LLMAdapter
 from dd_llm.registry import register_adapter
-from dd_llm.adapters.claude_cli import ClaudeCLIAdapter
-from dd_llm.adapters.openai_sdk import OpenAIAdapter
-from dd_llm.adapters.anthropic_sdk import AnthropicAdapter
-from dd_llm.adapters.gemini_sdk import GeminiAdapter
+
+
+def _lazy(module: str, cls: str) -> Callable[..., LLMAdapter]:
+    """Factory that imports ``dd_llm.adapters.<module>`` when first called."""
+
+    def factory(**kwargs) -> LLMAdapter:
+        adapter_cls = getattr(importlib.import_module(f"dd_llm.adapters.{module}"), cls)
+        return adapter_cls(**kwargs)
+
+    factory.__qualname__ = factory.__name__ = cls
+    return factory
 
 
 def _make_openrouter(**kwargs):
     """Factory for OpenRouter — OpenAI-compatible with custom base_url."""
+    from dd_llm.adapters.openai_sdk import OpenAIAdapter
+
     return OpenAIAdapter(
         api_key=kwargs.get("api_key") or os.environ.get("OPENROUTER_API_KEY", ""),
         base_url="https://openrouter.ai/api/v1",
         default_model=kwargs.get("default_model", "anthropic/claude-sonnet-4-5-20250929"),
         provider_name="openrouter",
+        http_client=kwargs.get("http_client"),
     )
 
 
 def _make_ollama(**kwargs):
     """Factory for Ollama — OpenAI-compatible with local base_url."""
+    from dd_llm.adapters.openai_sdk import OpenAIAdapter
+
     host = kwargs.get("host") or os.environ.get("OLLAMA_HOST", "http://localhost:11434")
     return OpenAIAdapter(
         api_key="ollama",
         base_url=f"{host}/v1",
         default_model=kwargs.get("default_model", "llama3.2"),
         provider_name="ollama",
+        http_client=kwargs.get("http_client"),
     )
 
 
-register_adapter("claude_cli", ClaudeCLIAdapter)
-register_adapter("openai", OpenAIAdapter)
-register_adapter("anthropic", AnthropicAdapter)
-register_adapter("gemini", GeminiAdapter)
+register_adapter("claude_cli", _lazy("claude_cli", "ClaudeCLIAdapter"))
+register_adapter("openai", _lazy("openai_sdk", "OpenAIAdapter"))
+register_adapter("anthropic", _lazy("anthropic_sdk", "AnthropicAdapter"))
+register_adapter("gemini", _lazy("gemini_sdk", "GeminiAdapter"))
 register_adapter("openrouter", _make_openrouter)
 register_adapter("ollama", _make_ollama)
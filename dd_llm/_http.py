@@ -0,0 +1,108 @@
+"""Process-wide, connection-pooled httpx clients for the SDK adapters.
+
+The OpenAI-compatible and Anthropic SDK clients created by dd-llm all send
+their requests through these pools, so calls to the same host (``openai``
+and ``openrouter`` adapters, retries, Ollama on loopback) reuse open TCP/TLS
+connections instead of handshaking again.  HTTP/2 is enabled when the
+``h2`` package is installed.
+
+Async connections belong to the event loop that opened them, so async
+clients are kept per loop; see :func:`per_loop`.
+
+Setting ``LLM_ORJSON=1`` makes ``httpx.Response.json()`` (which the SDKs use
+to decode every API response) parse with ``orjson`` when it is installed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Any, Callable
+
+MAX_KEEPALIVE_CONNECTIONS = 64
+
+_lock = threading.RLock()  # per_loop factories may re-enter
+_client = None
+_loop_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _patch_response_json(response_cls) -> bool:
+    """Make ``response_cls.json()`` parse ``.content`` with orjson.
+
+    Calls that pass ``json.loads`` keyword arguments keep the original
+    implementation.  Returns ``False`` if orjson is not installed.
+    """
+    try:
+        import orjson
+    except ImportError:
+        return False
+    original = response_cls.json
+    if getattr(original, "_dd_llm_orjson", False):
+        return True
+
+    def json(self, **kwargs):
+        if kwargs:
+            return original(self, **kwargs)
+        return orjson.loads(self.content)
+
+    json._dd_llm_orjson = True
+    response_cls.json = json
+    return True
+
+
+def _client_options() -> dict[str, Any]:
+    import httpx
+
+    if os.environ.get("LLM_ORJSON", "").lower() in ("1", "true", "yes"):
+        _patch_response_json(httpx.Response)
+
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        http2 = False
+    else:
+        http2 = True
+    return {
+        "http2": http2,
+        "limits": httpx.Limits(max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS),
+    }
+
+
+def per_loop(
+    registry: weakref.WeakKeyDictionary, key: Any, factory: Callable[[], Any]
+) -> Any:
+    """Return ``factory()`` memoised under *key* for the running event loop.
+
+    *registry* maps loops to ``{key: value}`` dicts; entries disappear with
+    their loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        values = registry.get(loop)
+        if values is None:
+            values = registry[loop] = {}
+        value = values.get(key)
+        if value is None:
+            value = values[key] = factory()
+    return value
+
+
+def shared_http_client():
+    """Return the shared ``httpx.Client``, creating it on first use."""
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                import httpx
+
+                _client = httpx.Client(**_client_options())
+    return _client
+
+
+def shared_async_http_client():
+    """Return the shared ``httpx.AsyncClient`` for the running event loop."""
+    import httpx
+
+    return per_loop(_loop_clients, None, lambda: httpx.AsyncClient(**_client_options()))
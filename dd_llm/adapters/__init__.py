@@ -1,13 +1,31 @@
-"""Built-in LLM adapter implementations."""
-
-from dd_llm.adapters.claude_cli import ClaudeCLIAdapter
-from dd_llm.adapters.openai_sdk import OpenAIAdapter
-from dd_llm.adapters.anthropic_sdk import AnthropicAdapter
-from dd_llm.adapters.gemini_sdk import GeminiAdapter
-
-__all__ = [
-    "ClaudeCLIAdapter",
-    "OpenAIAdapter",
-    "AnthropicAdapter",
-    "GeminiAdapter",
-]
+"""Built-in LLM adapter implementations.
+
+Each adapter is imported on first attribute access (PEP 562), so importing
+one does not load the others.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+_MODULES = {
+    "ClaudeCLIAdapter": "claude_cli",
+    "OpenAIAdapter": "openai_sdk",
+    "AnthropicAdapter": "anthropic_sdk",
+    "GeminiAdapter": "gemini_sdk",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -3,12 +3,74 @@
 from __future__ import annotations
 
 import os
+import threading
+import weakref
+from typing import Any
 
+from dd_llm._http import per_loop, shared_async_http_client, shared_http_client
 from dd_llm.base import LLMAdapter, LLMResponse
 
 
+def _text_block(text: str, cache_control: dict | None) -> dict[str, Any]:
+    block: dict[str, Any] = {"type": "text", "text": text}
+    if cache_control:
+        block["cache_control"] = cache_control
+    return block
+
+
+def _to_anthropic(
+    messages: list[dict], system: str | None
+) -> tuple[str | list[dict] | None, list[dict]]:
+    """Split dd-llm messages into Anthropic's ``system`` and ``messages`` params.
+
+    ``system``-role messages are lifted into the top-level system prompt (the
+    Messages API rejects them inline), and any ``cache_control`` marker is
+    moved onto a content block so Anthropic caches the prefix up to it.
+    """
+    system_blocks = [_text_block(system, None)] if system else []
+    converted: list[dict] = []
+    for m in messages:
+        cache_control = m.get("cache_control")
+        if m["role"] == "system":
+            system_blocks.append(_text_block(m["content"], cache_control))
+        elif cache_control and isinstance(m["content"], str):
+            converted.append({
+                "role": m["role"],
+                "content": [_text_block(m["content"], cache_control)],
+            })
+        else:
+            converted.append({"role": m["role"], "content": m["content"]})
+
+    if not system_blocks:
+        return None, converted
+    if any("cache_control" in b for b in system_blocks):
+        return system_blocks, converted
+    return "\n\n".join(b["text"] for b in system_blocks), converted
+
+
 class AnthropicAdapter(LLMAdapter):
-    """Adapter for the Anthropic Messages API."""
+    """Adapter for the Anthropic Messages API.
+
+    Messages marked with ``cache_control`` enable Anthropic prompt caching;
+    cache reads/writes are reported on the returned :class:`LLMResponse`.
+
+    Parameters
+    ----------
+    api_key : str or None
+        API key.  Falls back to ``ANTHROPIC_API_KEY`` env var.
+    default_model : str
+        Default model when none is specified per-call.
+    http_client : httpx.Client or None
+        Connection pool for synchronous calls.  Defaults to the pool shared by
+        all dd-llm adapters.
+    """
+
+    # SDK clients are shared by every adapter instance with the same
+    # credentials; async ones per event loop.  All of them send requests
+    # through dd-llm's shared httpx connection pools.
+    _clients: dict = {}
+    _async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    _clients_lock = threading.Lock()
 
     DEFAULT_MODEL = "claude-sonnet-4-5-20250929"
 
@@ -16,58 +78,119 @@ class AnthropicAdapter(LLMAdapter):
         self,
         api_key: str | None = None,
         default_model: str = "",
+        http_client=None,
     ):
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY", "")
         self.default_model = default_model or self.DEFAULT_MODEL
+        self.http_client = http_client
         self._client = None
 
     def _get_client(self):
         if self._client is None:
-            from anthropic import Anthropic
+            if self.http_client is not None:
+                from anthropic import Anthropic
+
+                # A caller-supplied pool gets a private SDK client
+                self._client = Anthropic(api_key=self.api_key, http_client=self.http_client)
+                return self._client
+            with self._clients_lock:
+                client = self._clients.get(self.api_key)
+                if client is None:
+                    from anthropic import Anthropic
 
-            self._client = Anthropic(api_key=self.api_key)
+                    client = self._clients[self.api_key] = Anthropic(
+                        api_key=self.api_key, http_client=shared_http_client()
+                    )
+            self._client = client
         return self._client
 
-    def call(
-        self,
-        prompt: str = "",
-        *,
-        model: str = "",
-        messages: list[dict] | None = None,
-        system: str | None = None,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
-        **kwargs,
-    ) -> LLMResponse:
-        start = self._measure_time()
-        effective_model = model or self.default_model
+    def _get_async_client(self):
+        def make():
+            from anthropic import AsyncAnthropic
+
+            return AsyncAnthropic(
+                api_key=self.api_key, http_client=shared_async_http_client()
+            )
 
+        return per_loop(self._async_clients, self.api_key, make)
+
+    def _request(
+        self,
+        prompt: str,
+        model: str,
+        messages: list[dict] | None,
+        system: str | None,
+        max_tokens: int,
+        temperature: float,
+        kwargs: dict,
+    ) -> dict:
+        """Build the ``messages.create`` arguments for one call."""
         if messages is None:
             messages = [{"role": "user", "content": prompt}]
+        system_param, messages = _to_anthropic(messages, system)
 
         call_kwargs: dict = {
-            "model": effective_model,
+            "model": model or self.default_model,
             "messages": messages,
             "max_tokens": max_tokens,
             "temperature": temperature,
             **kwargs,
         }
-        if system:
-            call_kwargs["system"] = system
-
-        client = self._get_client()
-        resp = client.messages.create(**call_kwargs)
+        if system_param:
+            call_kwargs["system"] = system_param
+        return call_kwargs
 
-        latency = self._elapsed_ms(start)
+    def _to_response(self, resp, model: str, start: int) -> LLMResponse:
+        latency = self._elapsed_ms_ns(start)
+        usage = resp.usage
         return LLMResponse(
             content=resp.content[0].text if resp.content else "",
             success=True,
             provider="anthropic",
-            model=effective_model,
-            input_tokens=resp.usage.input_tokens if resp.usage else 0,
-            output_tokens=resp.usage.output_tokens if resp.usage else 0,
+            model=model,
+            input_tokens=usage.input_tokens if usage else 0,
+            output_tokens=usage.output_tokens if usage else 0,
             latency_ms=latency,
+            cache_read_input_tokens=getattr(usage, "cache_read_input_tokens", 0) or 0,
+            cache_creation_input_tokens=getattr(usage, "cache_creation_input_tokens", 0) or 0,
+        )
+
+    def call(
+        self,
+        prompt: str = "",
+        *,
+        model: str = "",
+        messages: list[dict] | None = None,
+        system: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs,
+    ) -> LLMResponse:
+        start = self._measure_time_ns()
+        request = self._request(
+            prompt, model, messages, system, max_tokens, temperature, kwargs
+        )
+        resp = self._get_client().messages.create(**request)
+        return self._to_response(resp, request["model"], start)
+
+    async def acall(
+        self,
+        prompt: str = "",
+        *,
+        model: str = "",
+        messages: list[dict] | None = None,
+        system: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs,
+    ) -> LLMResponse:
+        """Native async call through ``AsyncAnthropic`` (no worker thread)."""
+        start = self._measure_time_ns()
+        request = self._request(
+            prompt, model, messages, system, max_tokens, temperature, kwargs
         )
+        resp = await self._get_async_client().messages.create(**request)
+        return self._to_response(resp, request["model"], start)
 
     def list_models(self) -> list[str]:
         return [self.DEFAULT_MODEL]
@@ -7,15 +7,58 @@ development.  Invokes ``claude -p "<prompt>"`` via subprocess.
 from __future__ import annotations
 
 import subprocess
+import threading
 
 from dd_llm.base import LLMAdapter, LLMResponse
 
+_encoding = None  # tiktoken encoding, loaded on first use; False if unavailable
+
+
+def _estimate_tokens(text: str) -> int:
+    """Count tokens with tiktoken when installed, else ~4 characters per token."""
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception:  # not installed, or BPE file unavailable offline
+            _encoding = False
+    if _encoding:
+        return len(_encoding.encode_ordinary(text))
+    return len(text) // 4
+
+
+def _decode_stripped(data: bytes) -> str:
+    """Decode CLI output, trimming ASCII whitespace before decoding.
+
+    ``bytes.strip()`` trims in C without decoding the payload first; the
+    final ``str.strip()`` only inspects the ends, catching any non-ASCII
+    whitespace, and is a no-op copy-wise when there is none.
+    """
+    return data.strip().decode("utf-8", errors="replace").strip()
+
 
 class ClaudeCLIAdapter(LLMAdapter):
     """LLM adapter that wraps the Claude Code CLI.
 
     Designed for development use — leverages existing Claude Code subscription
     (flat billing = zero marginal cost per call).
+
+    Parameters
+    ----------
+    cli_path : str
+        Path to the ``claude`` executable.
+    timeout : int
+        Seconds to wait for one response.
+    allowed_tools : list of str or None
+        Tools passed to ``--allowedTools``.
+    prewarm : bool
+        Keep a standby ``claude -p`` process started ahead of time.  Each
+        call hands its prompt to the standby over stdin and immediately
+        starts the next one, so CLI startup overlaps the previous call
+        instead of delaying this one.  Every call still gets a fresh process
+        (and thus a fresh conversation).  Call :meth:`close` when done.
     """
 
     def __init__(
@@ -23,10 +66,66 @@ class ClaudeCLIAdapter(LLMAdapter):
         cli_path: str = "claude",
         timeout: int = 300,
         allowed_tools: list[str] | None = None,
+        prewarm: bool = False,
     ):
         self.cli_path = cli_path
         self.timeout = timeout
         self.allowed_tools = allowed_tools or []
+        self.prewarm = prewarm
+        self._standby: subprocess.Popen | None = None
+        self._standby_lock = threading.Lock()
+
+    def _base_cmd(self) -> list[str]:
+        cmd = [self.cli_path, "-p"]
+        if self.allowed_tools:
+            cmd += ["--allowedTools", ",".join(self.allowed_tools)]
+        return cmd
+
+    def _spawn(self) -> subprocess.Popen:
+        # With no prompt argument, ``claude -p`` reads the prompt from stdin
+        return subprocess.Popen(
+            self._base_cmd(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+    def _take_standby(self) -> subprocess.Popen:
+        """Return a started CLI process and launch its replacement."""
+        with self._standby_lock:
+            proc, self._standby = self._standby, None
+            if proc is None or proc.poll() is not None:
+                proc = self._spawn()
+            self._standby = self._spawn()
+        return proc
+
+    def _run_prewarmed(
+        self, full_prompt: str, timeout: float
+    ) -> subprocess.CompletedProcess:
+        proc = self._take_standby()
+        try:
+            stdout, stderr = proc.communicate(
+                full_prompt.encode("utf-8"), timeout=timeout
+            )
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        return subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+
+    def close(self) -> None:
+        """Terminate the standby process, if any."""
+        with self._standby_lock:
+            proc, self._standby = self._standby, None
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            proc.communicate()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
 
     def call(
         self,
@@ -37,10 +136,15 @@ class ClaudeCLIAdapter(LLMAdapter):
         system: str | None = None,
         max_tokens: int = 4096,
         temperature: float = 0.7,
+        timeout: float | None = None,
         **kwargs,
     ) -> LLMResponse:
-        """Generate response by invoking the claude CLI."""
-        start = self._measure_time()
+        """Generate response by invoking the claude CLI.
+
+        *timeout* overrides the instance's timeout for this call.
+        """
+        start = self._measure_time_ns()
+        timeout = timeout or self.timeout
 
         # Build effective prompt from messages or prompt string
         if messages:
@@ -53,17 +157,17 @@ class ClaudeCLIAdapter(LLMAdapter):
         if system:
             full_prompt = f"System: {system}\n\nUser: {full_prompt}"
 
-        # Build CLI command
-        cmd = [self.cli_path, "-p", full_prompt]
-        if self.allowed_tools:
-            cmd += ["--allowedTools", ",".join(self.allowed_tools)]
-
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                timeout=self.timeout,
-            )
+            if self.prewarm:
+                result = self._run_prewarmed(full_prompt, timeout)
+            else:
+                cmd = self._base_cmd()
+                cmd.insert(2, full_prompt)
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    timeout=timeout,
+                )
         except FileNotFoundError:
             return LLMResponse(
                 content="",
@@ -83,15 +187,15 @@ class ClaudeCLIAdapter(LLMAdapter):
                 provider="claude_cli",
                 model="claude-cli",
                 error_history=[{
-                    "error": f"Claude CLI timed out after {self.timeout}s",
+                    "error": f"Claude CLI timed out after {timeout}s",
                     "error_type": "TimeoutError",
                 }],
             )
 
-        latency = self._elapsed_ms(start)
+        latency = self._elapsed_ms_ns(start)
 
         if result.returncode != 0:
-            error_msg = result.stderr.decode("utf-8", errors="replace").strip()
+            error_msg = _decode_stripped(result.stderr)
             return LLMResponse(
                 content="",
                 success=False,
@@ -104,11 +208,10 @@ class ClaudeCLIAdapter(LLMAdapter):
                 }],
             )
 
-        content = result.stdout.decode("utf-8", errors="replace").strip()
+        content = _decode_stripped(result.stdout)
 
-        # Estimate tokens (~4 chars per token)
-        input_tokens = max(1, len(full_prompt) // 4)
-        output_tokens = max(1, len(content) // 4) if content else 0
+        input_tokens = max(1, _estimate_tokens(full_prompt))
+        output_tokens = max(1, _estimate_tokens(content)) if content else 0
 
         return LLMResponse(
             content=content,
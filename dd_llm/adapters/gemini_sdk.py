@@ -3,13 +3,24 @@
 from __future__ import annotations
 
 import os
+import threading
+import weakref
 
+from dd_llm._http import per_loop
 from dd_llm.base import LLMAdapter, LLMResponse
 
 
 class GeminiAdapter(LLMAdapter):
     """Adapter for the Google Gemini API via google-genai SDK."""
 
+    # SDK clients, and with them their HTTP connection pools, are shared by
+    # every adapter instance with the same credentials / endpoint.
+    _clients: dict = {}
+    _clients_lock = threading.Lock()
+    # The client's ``aio`` surface binds its connections to the event loop
+    # that first uses it, so async callers get one client per loop.
+    _async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
     DEFAULT_MODEL = "gemini-2.0-flash"
 
     def __init__(
@@ -23,25 +34,25 @@ class GeminiAdapter(LLMAdapter):
 
     def _get_client(self):
         if self._client is None:
-            from google import genai
+            with self._clients_lock:
+                client = self._clients.get(self.api_key)
+                if client is None:
+                    from google import genai
 
-            self._client = genai.Client(api_key=self.api_key)
+                    client = self._clients[self.api_key] = genai.Client(api_key=self.api_key)
+            self._client = client
         return self._client
 
-    def call(
-        self,
-        prompt: str = "",
-        *,
-        model: str = "",
-        messages: list[dict] | None = None,
-        system: str | None = None,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
-        **kwargs,
-    ) -> LLMResponse:
-        start = self._measure_time()
-        effective_model = model or self.default_model
+    def _get_async_client(self):
+        def make():
+            from google import genai
+
+            return genai.Client(api_key=self.api_key).aio
 
+        return per_loop(self._async_clients, self.api_key, make)
+
+    @staticmethod
+    def _contents(prompt: str, messages: list[dict] | None, system: str | None) -> str:
         # Convert messages to a single string for Gemini
         if messages:
             contents = "\n".join(
@@ -52,15 +63,10 @@ class GeminiAdapter(LLMAdapter):
 
         if system:
             contents = f"System: {system}\n\n{contents}"
+        return contents
 
-        client = self._get_client()
-        resp = client.models.generate_content(
-            model=effective_model,
-            contents=contents,
-            **kwargs,
-        )
-
-        latency = self._elapsed_ms(start)
+    def _to_response(self, resp, model: str, start: int) -> LLMResponse:
+        latency = self._elapsed_ms_ns(start)
 
         # Extract token usage if available
         input_tokens = 0
@@ -73,11 +79,56 @@ class GeminiAdapter(LLMAdapter):
             content=resp.text or "",
             success=True,
             provider="gemini",
-            model=effective_model,
+            model=model,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             latency_ms=latency,
         )
 
+    def call(
+        self,
+        prompt: str = "",
+        *,
+        model: str = "",
+        messages: list[dict] | None = None,
+        system: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs,
+    ) -> LLMResponse:
+        # google-genai sets timeouts on the client, not per request
+        kwargs.pop("timeout", None)
+        start = self._measure_time_ns()
+        effective_model = model or self.default_model
+        resp = self._get_client().models.generate_content(
+            model=effective_model,
+            contents=self._contents(prompt, messages, system),
+            **kwargs,
+        )
+        return self._to_response(resp, effective_model, start)
+
+    async def acall(
+        self,
+        prompt: str = "",
+        *,
+        model: str = "",
+        messages: list[dict] | None = None,
+        system: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        **kwargs,
+    ) -> LLMResponse:
+        """Native async call through the client's ``aio`` surface."""
+        # google-genai sets timeouts on the client, not per request
+        kwargs.pop("timeout", None)
+        start = self._measure_time_ns()
+        effective_model = model or self.default_model
+        resp = await self._get_async_client().models.generate_content(
+            model=effective_model,
+            contents=self._contents(prompt, messages, system),
+            **kwargs,
+        )
+        return self._to_response(resp, effective_model, start)
+
     def list_models(self) -> list[str]:
         return [self.DEFAULT_MODEL]
@@ -2,14 +2,93 @@
 
 from __future__ import annotations
 
+import json
 import os
+import threading
+import weakref
+from collections.abc import Collection
 
+from dd_llm._http import per_loop, shared_async_http_client, shared_http_client
 from dd_llm.base import LLMAdapter, LLMResponse
 
 
+def _completed_fields(text: str) -> dict | None:
+    """Top-level fields of a partial JSON object whose values are complete.
+
+    Uses jiter's partial mode; the last field seen may still be streaming,
+    so it is left out.  Returns ``None`` if jiter is not installed or *text*
+    is not (the start of) a JSON object.
+    """
+    try:
+        import jiter
+    except ImportError:
+        return None
+    head = text.rstrip()
+    if head.endswith(","):
+        # Closing the object right after a top-level comma yields valid JSON
+        # exactly when every value so far is complete
+        try:
+            obj = jiter.from_json((head[:-1] + "}").encode("utf-8"))
+        except ValueError:
+            pass
+        else:
+            return obj if isinstance(obj, dict) else None
+    try:
+        obj = jiter.from_json(text.encode("utf-8"), partial_mode="trailing-strings")
+    except ValueError:
+        return None
+    if not isinstance(obj, dict) or not obj:
+        return None
+    obj.pop(next(reversed(obj)))
+    return obj
+
+
+class _StreamCollector:
+    """Accumulates streamed chat-completion chunks into one LLMResponse.
+
+    With *required_keys*, :meth:`feed` returns ``True`` as soon as the
+    streamed JSON object holds complete values for all of them, so the
+    caller can close the stream early.
+    """
+
+    def __init__(self, required_keys: Collection[str] | None):
+        self.required_keys = set(required_keys or ())
+        self.parts: list[str] = []
+        self.usage = None
+        self.early: dict | None = None
+
+    def feed(self, chunk) -> bool:
+        if getattr(chunk, "usage", None):
+            self.usage = chunk.usage
+        if not chunk.choices:
+            return False
+        delta = chunk.choices[0].delta.content
+        if not delta:
+            return False
+        self.parts.append(delta)
+        # A top-level value can only have ended at a "," (or the final "}")
+        if self.required_keys and "," in delta:
+            fields = _completed_fields("".join(self.parts))
+            if fields is not None and self.required_keys <= fields.keys():
+                self.early = fields
+                return True
+        return False
+
+    def content(self) -> str:
+        if self.early is not None:
+            return json.dumps(self.early)
+        return "".join(self.parts)
+
+
 class OpenAIAdapter(LLMAdapter):
     """Adapter for OpenAI-compatible APIs (OpenAI, OpenRouter, Ollama).
 
+    ``call(..., stream=True)`` streams the completion.  Adding
+    ``required_keys=[...]`` for a JSON reply stops reading once every listed
+    top-level field is complete (requires ``jiter``, a dependency of recent
+    ``openai`` releases); the response content is then the JSON of the
+    fields received so far.
+
     Parameters
     ----------
     api_key : str or None
@@ -20,73 +99,202 @@ class OpenAIAdapter(LLMAdapter):
         Default model when none is specified per-call.
     provider_name : str
         Name used in LLMResponse.provider (e.g. "openai", "openrouter").
+    http_client : httpx.Client or None
+        Connection pool for synchronous calls.  Defaults to the pool shared by
+        all dd-llm adapters.
     """
 
+    # SDK clients are shared by every adapter instance with the same
+    # credentials / endpoint; async ones per event loop.  All of them send
+    # requests through dd-llm's shared httpx connection pools.
+    _clients: dict = {}
+    _async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+    _clients_lock = threading.Lock()
+
     def __init__(
         self,
         api_key: str | None = None,
         base_url: str | None = None,
         default_model: str = "gpt-4o",
         provider_name: str = "openai",
+        http_client=None,
     ):
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY", "")
         self.base_url = base_url
         self.default_model = default_model
         self.provider_name = provider_name
+        self.http_client = http_client
         self._client = None
 
+    def _client_kwargs(self) -> dict:
+        kwargs: dict = {"api_key": self.api_key}
+        if self.base_url:
+            kwargs["base_url"] = self.base_url
+        return kwargs
+
     def _get_client(self):
         if self._client is None:
-            from openai import OpenAI
+            if self.http_client is not None:
+                from openai import OpenAI
+
+                # A caller-supplied pool gets a private SDK client
+                self._client = OpenAI(**self._client_kwargs(), http_client=self.http_client)
+                return self._client
+            key = (self.api_key, self.base_url)
+            with self._clients_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    from openai import OpenAI
 
-            kwargs: dict = {"api_key": self.api_key}
-            if self.base_url:
-                kwargs["base_url"] = self.base_url
-            self._client = OpenAI(**kwargs)
+                    client = self._clients[key] = OpenAI(
+                        **self._client_kwargs(), http_client=shared_http_client()
+                    )
+            self._client = client
         return self._client
 
-    def call(
-        self,
-        prompt: str = "",
-        *,
-        model: str = "",
-        messages: list[dict] | None = None,
-        system: str | None = None,
-        max_tokens: int = 4096,
-        temperature: float = 0.7,
-        **kwargs,
-    ) -> LLMResponse:
-        start = self._measure_time()
-        effective_model = model or self.default_model
+    def _get_async_client(self):
+        def make():
+            from openai import AsyncOpenAI
 
+            return AsyncOpenAI(
+                **self._client_kwargs(), http_client=shared_async_http_client()
+            )
+
+        return per_loop(self._async_clients, (self.api_key, self.base_url), make)
+
+    def _request(
+        self,
+        prompt: str,
+        model: str,
+        messages: list[dict] | None,
+        system: str | None,
+        max_tokens: int,
+        temperature: float,
+        kwargs: dict,
+    ) -> dict:
+        """Build the ``chat.completions.create`` arguments for one call."""
         if messages is None:
             messages = []
             if system:
                 messages.append({"role": "system", "content": system})
             messages.append({"role": "user", "content": prompt})
-        elif system:
-            messages = [{"role": "system", "content": system}] + messages
+        else:
+            if any("cache_control" in m for m in messages):
+                # OpenAI caches prompt prefixes automatically; drop the markers
+                messages = [
+                    {k: v for k, v in m.items() if k != "cache_control"}
+                    for m in messages
+                ]
+            if system:
+                messages = [{"role": "system", "content": system}, *messages]
 
-        client = self._get_client()
-        resp = client.chat.completions.create(
-            model=effective_model,
-            messages=messages,
-            max_tokens=max_tokens,
-            temperature=temperature,
+        return {
+            "model": model or self.default_model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
             **kwargs,
-        )
+        }
 
-        latency = self._elapsed_ms(start)
+    def _to_response(self, resp, model: str, start: int) -> LLMResponse:
+        latency = self._elapsed_ms_ns(start)
         usage = resp.usage
+        details = getattr(usage, "prompt_tokens_details", None)
         return LLMResponse(
             content=resp.choices[0].message.content or "",
             success=True,
             provider=self.provider_name,
-            model=effective_model,
+            model=model,
             input_tokens=usage.prompt_tokens if usage else 0,
             output_tokens=usage.completion_tokens if usage else 0,
             latency_ms=latency,
+            cache_read_input_tokens=getattr(details, "cached_tokens", 0) or 0,
+        )
+
+    def _stream_response(
+        self, collector: _StreamCollector, model: str, start: int
+    ) -> LLMResponse:
+        usage = collector.usage
+        details = getattr(usage, "prompt_tokens_details", None)
+        return LLMResponse(
+            content=collector.content(),
+            success=True,
+            provider=self.provider_name,
+            model=model,
+            input_tokens=usage.prompt_tokens if usage else 0,
+            output_tokens=usage.completion_tokens if usage else 0,
+            latency_ms=self._elapsed_ms_ns(start),
+            cache_read_input_tokens=getattr(details, "cached_tokens", 0) or 0,
+        )
+
+    @staticmethod
+    def _stream_request(request: dict) -> dict:
+        return {**request, "stream": True, "stream_options": {"include_usage": True}}
+
+    def call(
+        self,
+        prompt: str = "",
+        *,
+        model: str = "",
+        messages: list[dict] | None = None,
+        system: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        stream: bool = False,
+        required_keys: Collection[str] | None = None,
+        **kwargs,
+    ) -> LLMResponse:
+        start = self._measure_time_ns()
+        request = self._request(
+            prompt, model, messages, system, max_tokens, temperature, kwargs
+        )
+        client = self._get_client()
+        if not (stream or required_keys):
+            resp = client.chat.completions.create(**request)
+            return self._to_response(resp, request["model"], start)
+
+        collector = _StreamCollector(required_keys)
+        chunks = client.chat.completions.create(**self._stream_request(request))
+        try:
+            for chunk in chunks:
+                if collector.feed(chunk):
+                    break
+        finally:
+            chunks.close()
+        return self._stream_response(collector, request["model"], start)
+
+    async def acall(
+        self,
+        prompt: str = "",
+        *,
+        model: str = "",
+        messages: list[dict] | None = None,
+        system: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        stream: bool = False,
+        required_keys: Collection[str] | None = None,
+        **kwargs,
+    ) -> LLMResponse:
+        """Native async call through ``AsyncOpenAI`` (no worker thread)."""
+        start = self._measure_time_ns()
+        request = self._request(
+            prompt, model, messages, system, max_tokens, temperature, kwargs
         )
+        client = self._get_async_client()
+        if not (stream or required_keys):
+            resp = await client.chat.completions.create(**request)
+            return self._to_response(resp, request["model"], start)
+
+        collector = _StreamCollector(required_keys)
+        chunks = await client.chat.completions.create(**self._stream_request(request))
+        try:
+            async for chunk in chunks:
+                if collector.feed(chunk):
+                    break
+        finally:
+            await chunks.close()
+        return self._stream_response(collector, request["model"], start)
 
     def list_models(self) -> list[str]:
         try:
@@ -8,12 +8,19 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """Structured LLM response with metadata.
 
     Merges fields from PocoFlow's LLMResponse (retry/fallback metadata)
     and SPL's GenerationResult (token usage and cost tracking).
+
+    ``cached`` marks responses served from a dd-llm cache, while the
+    ``cache_*_input_tokens`` fields report provider-side prompt caching.
+
+    Instances are slotted (no per-instance ``__dict__``), so batch pipelines
+    that hold many responses stay compact.  Fields remain mutable: the
+    provider fills in retry metadata after an adapter returns.
     """
 
     content: str
@@ -27,6 +34,9 @@ class LLMResponse:
     attempts: int = 1
     total_time: float = 0.0
     error_history: list[dict[str, Any]] | None = None
+    cached: bool = False
+    cache_read_input_tokens: int = 0
+    cache_creation_input_tokens: int = 0
 
 
 class LLMAdapter(ABC):
@@ -35,6 +45,19 @@ class LLMAdapter(ABC):
     All dd-llm backends must implement the synchronous ``call()`` method.
     Adapters that use async SDKs internally should use ``asyncio.run()``
     within their ``call()`` implementation.
+
+    A message dict may carry an optional ``"cache_control"`` entry (e.g.
+    ``{"type": "ephemeral"}``) marking the end of a stable prompt prefix.
+    Adapters for providers with explicit prompt caching forward it; the
+    others must ignore it.
+
+    ``acall()`` is the awaitable counterpart.  The default runs ``call()`` in
+    a worker thread so that many calls can be overlapped with
+    ``asyncio.gather``; adapters with a native async client may override it.
+
+    ``batch_call()`` answers many independent prompts at once.  The default
+    fans them out concurrently over ``acall()``; adapters whose backend
+    accepts several prompts in one request should override it.
     """
 
     @abstractmethod
@@ -52,6 +75,40 @@ class LLMAdapter(ABC):
         """Synchronous LLM call. Returns LLMResponse (always, even on failure)."""
         ...
 
+    async def acall(self, prompt: str = "", **kwargs) -> LLMResponse:
+        """Asynchronous LLM call.  Accepts the same arguments as ``call()``."""
+        import asyncio
+
+        return await asyncio.to_thread(self.call, prompt, **kwargs)
+
+    def batch_call(
+        self,
+        prompts: list[str],
+        *,
+        max_concurrency: int | None = None,
+        **kwargs,
+    ) -> list[LLMResponse]:
+        """Call the LLM once per prompt; results are returned in *prompts* order.
+
+        At most *max_concurrency* requests are in flight at once (unbounded
+        when ``None``), which keeps large batches within provider rate
+        limits.  Must not be called from a running event loop — gather
+        ``acall()`` coroutines there instead.
+        """
+        # Imported here so sync-only users of dd_llm never load asyncio
+        import asyncio
+
+        limit = asyncio.Semaphore(max_concurrency or len(prompts) or 1)
+
+        async def one(prompt: str) -> LLMResponse:
+            async with limit:
+                return await self.acall(prompt, **kwargs)
+
+        async def _gather() -> list[LLMResponse]:
+            return await asyncio.gather(*(one(p) for p in prompts))
+
+        return asyncio.run(_gather())
+
     def list_models(self) -> list[str]:
         """List available models for this adapter."""
         return []
@@ -63,3 +120,12 @@ class LLMAdapter(ABC):
     def _elapsed_ms(self, start: float) -> float:
         """Calculate elapsed milliseconds since *start*."""
         return (time.perf_counter() - start) * 1000
+
+    # Integer-nanosecond variants used by the built-in adapters.  Bound
+    # straight to the C clock: no Python frame or float math on the start read.
+    _measure_time_ns = staticmethod(time.perf_counter_ns)
+
+    @staticmethod
+    def _elapsed_ms_ns(start: int) -> float:
+        """Calculate elapsed milliseconds since *start* from :meth:`_measure_time_ns`."""
+        return (time.perf_counter_ns() - start) / 1e6
@@ -0,0 +1,318 @@
+"""Exact-match response caching.
+
+``CachingAdapter`` wraps any :class:`LLMAdapter` and short-circuits repeated
+calls that share the same provider, model, sampling parameters and
+conversation, returning the stored :class:`LLMResponse` instead of making
+another network round trip.
+
+``ResponseCache`` lives in process memory; ``DiskCache`` keeps responses in
+a SQLite file so repeated runs (dev loops, CI) skip the network entirely.
+Either can also be passed to ``UnifiedLLMProvider(cache=...)``.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from dd_llm.base import LLMAdapter, LLMResponse
+
+# Temperature the adapters sample at when a request does not set one
+DEFAULT_TEMPERATURE = 0.7
+
+
+def make_cache_key(
+    provider: str,
+    model: str,
+    messages: list[dict],
+    **params: Any,
+) -> str:
+    """Return a stable SHA-256 hex digest identifying an LLM request.
+
+    *params* holds everything else that influences the output
+    (``temperature``, ``system``, ``max_tokens``, ...).  Values that are not
+    JSON-serialisable are keyed by their ``repr()``.
+    """
+    payload = json.dumps(
+        {"provider": provider, "model": model, "messages": messages, "params": params},
+        sort_keys=True,
+        default=repr,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def is_cacheable(temperature: float | None, max_temperature: float) -> bool:
+    """Whether a request sampled at *temperature* may use a response cache.
+
+    Requests above *max_temperature* are meant to vary and bypass caching.
+    ``None`` (temperature left to the adapter) counts as
+    :data:`DEFAULT_TEMPERATURE`, i.e. as sampled.
+    """
+    if temperature is None:
+        temperature = DEFAULT_TEMPERATURE
+    return temperature <= max_temperature
+
+
+def normalize_messages(messages: list[dict]) -> list[dict]:
+    """Return *messages* with text content lowercased and whitespace collapsed.
+
+    Used for cache keys only, so prompts differing just in case or spacing
+    share an entry.  Non-string content is left as is.
+    """
+    return [
+        {**m, "content": " ".join(m["content"].split()).lower()}
+        if isinstance(m.get("content"), str)
+        else m
+        for m in messages
+    ]
+
+
+def copy_response(response: LLMResponse) -> LLMResponse:
+    """Return a copy of *response* that shares no mutable state with it.
+
+    In-memory caches store and hand out copies, so a caller mutating a
+    returned response (it is a plain mutable dataclass) cannot change what
+    later hits see.
+    """
+    history = response.error_history
+    return dataclasses.replace(
+        response, error_history=None if history is None else [dict(e) for e in history]
+    )
+
+
+class ResponseCache:
+    """In-process LRU store mapping cache keys to :class:`LLMResponse` objects.
+
+    Safe to share between threads.  Responses are copied on the way in and
+    out (see :func:`copy_response`).
+
+    Parameters
+    ----------
+    max_entries : int
+        Least recently used entries are evicted beyond this size.
+    ttl_seconds : float or None
+        Entries older than this are treated as misses.  ``None`` keeps them
+        until evicted.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float | None = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        # key -> (response, monotonic expiry time or None)
+        self._data: OrderedDict[str, tuple[LLMResponse, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return the cached response for *key*, or ``None`` on a miss."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[1] is not None and entry[1] <= time.monotonic():
+                del self._data[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+        return copy_response(entry[0])
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        """Store *response*, evicting the least recently used entry if full."""
+        expires = None if self.ttl_seconds is None else time.monotonic() + self.ttl_seconds
+        response = copy_response(response)
+        with self._lock:
+            self._data[key] = (response, expires)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, LLMResponse]:
+        """Return the cached responses among *keys* (misses are omitted)."""
+        found = {}
+        for key in keys:
+            response = self.get(key)
+            if response is not None:
+                found[key] = response
+        return found
+
+    def set_many(self, items: Mapping[str, LLMResponse]) -> None:
+        """Store all *items* (same as calling :meth:`set` for each)."""
+        for key, response in items.items():
+            self.set(key, response)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """SQLite-backed store of :class:`LLMResponse` objects, keyed like :class:`ResponseCache`.
+
+    Entries persist across processes; the file is created on first use.
+    Safe to share between threads.  :meth:`get_many` / :meth:`set_many`
+    hydrate or fill many entries with one query / one transaction, e.g.
+    to look up a whole prompt set before sending only the misses.
+    """
+
+    # Stay under SQLite's host-parameter limit (999 before 3.32)
+    _BATCH = 500
+
+    def __init__(self, path: str):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._db.commit()
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return the cached response for *key*, or ``None`` on a miss."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return LLMResponse(**json.loads(row[0]))
+
+    def set(self, key: str, response: LLMResponse) -> None:
+        """Store *response* under *key*, replacing any previous entry."""
+        value = json.dumps(dataclasses.asdict(response))
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+            self._db.commit()
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, LLMResponse]:
+        """Return the cached responses among *keys* (misses are omitted)."""
+        keys = list(dict.fromkeys(keys))
+        rows: list[tuple[str, str]] = []
+        with self._lock:
+            for i in range(0, len(keys), self._BATCH):
+                batch = keys[i:i + self._BATCH]
+                marks = ",".join("?" * len(batch))
+                rows += self._db.execute(
+                    f"SELECT key, value FROM responses WHERE key IN ({marks})", batch
+                ).fetchall()
+            self.hits += len(rows)
+            self.misses += len(keys) - len(rows)
+        return {key: LLMResponse(**json.loads(value)) for key, value in rows}
+
+    def set_many(self, items: Mapping[str, LLMResponse]) -> None:
+        """Store all *items* in a single transaction."""
+        rows = [
+            (key, json.dumps(dataclasses.asdict(response)))
+            for key, response in items.items()
+        ]
+        with self._lock:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO responses (key, value) VALUES (?, ?)", rows
+            )
+            self._db.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+            self._db.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+
+class CachingAdapter(LLMAdapter):
+    """Adapter wrapper that serves repeated requests from a :class:`ResponseCache`.
+
+    Parameters
+    ----------
+    inner : LLMAdapter
+        The adapter that performs real calls on a cache miss.
+    cache : ResponseCache, DiskCache or None
+        Shared cache instance.  A private in-memory one is created when omitted.
+    name : str or None
+        Provider name used in the cache key.  Defaults to the inner class name.
+    max_temperature : float
+        Requests sampled above this temperature bypass the cache, since their
+        output is intentionally non-deterministic.
+    """
+
+    def __init__(
+        self,
+        inner: LLMAdapter,
+        cache: ResponseCache | DiskCache | None = None,
+        name: str | None = None,
+        max_temperature: float = 0.0,
+    ):
+        self.inner = inner
+        self.cache = cache if cache is not None else ResponseCache()
+        self.name = name or type(inner).__name__
+        self.max_temperature = max_temperature
+
+    def call(
+        self,
+        prompt: str = "",
+        *,
+        model: str = "",
+        messages: list[dict] | None = None,
+        system: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = DEFAULT_TEMPERATURE,
+        **kwargs,
+    ) -> LLMResponse:
+        call_kwargs = dict(
+            model=model,
+            messages=messages,
+            system=system,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs,
+        )
+        if not is_cacheable(temperature, self.max_temperature):
+            return self.inner.call(prompt, **call_kwargs)
+
+        key = make_cache_key(
+            self.name,
+            model or getattr(self.inner, "default_model", ""),
+            messages if messages is not None else [{"role": "user", "content": prompt}],
+            system=system,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs,
+        )
+        hit = self.cache.get(key)
+        if hit is not None:
+            return dataclasses.replace(hit, latency_ms=0.0, cost_usd=0.0, cached=True)
+
+        result = self.inner.call(prompt, **call_kwargs)
+        if result.success:
+            self.cache.set(key, result)
+        return result
+
+    def list_models(self) -> list[str]:
+        return self.inner.list_models()
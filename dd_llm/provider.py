@@ -6,13 +6,58 @@ adapter registry instead of hard-coded client factories.
 
 from __future__ import annotations
 
+import dataclasses
+import itertools
 import os
-import random
+import threading
 import time
-from typing import Any
+from collections import deque
+from collections.abc import Iterable, MutableSequence, Sequence
+from random import random as _rand
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
 
-from dd_llm.base import LLMResponse
-from dd_llm.registry import get_adapter, list_adapters
+from dd_llm.base import LLMAdapter, LLMResponse
+from dd_llm.registry import get_adapter, is_registered
+
+# asyncio, concurrent.futures, statistics and the cache modules are imported
+# where they are used, so that ``import dd_llm`` stays cheap for sync callers
+# that never cache, hedge or coalesce.
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from dd_llm.cache import DiskCache, ResponseCache
+    from dd_llm.semcache import SemanticCache
+
+_ERROR_CONTEXT_HEADER = "Previous attempts failed with the following errors:"
+_ERROR_CONTEXT_FOOTER = "\nPlease analyse these errors and provide a corrected response."
+
+
+def _make_error_dict(provider: str, attempt: int, exc: BaseException) -> dict[str, Any]:
+    """Error-history entry for *exc* raised by *provider* on *attempt* (1-based)."""
+    return {
+        "provider": provider,
+        "attempt": attempt,
+        "error": str(exc),
+        "error_type": exc.__class__.__name__,
+        "timestamp": time.time(),
+    }
+
+
+class _ErrorLog(deque):
+    """Bounded error history that still counts every failed attempt."""
+
+    def __init__(self, maxlen: int):
+        super().__init__(maxlen=maxlen)
+        self.total = 0
+
+    def record(self, failure: LLMResponse) -> None:
+        """Keep the errors of a failed provider result and count all its attempts.
+
+        The provider's own history may already be truncated, so the count
+        comes from ``failure.attempts`` rather than from its errors.
+        """
+        self.extend(failure.error_history or [])
+        self.total += failure.attempts
 
 
 class UnifiedLLMProvider:
@@ -29,15 +74,72 @@ class UnifiedLLMProvider:
     LLM_MAX_RETRIES     Max retry attempts per provider (default: 3).
     LLM_INITIAL_WAIT    Initial backoff seconds (default: 1).
     LLM_MAX_WAIT        Maximum backoff seconds (default: 30).
+
+    Parameters
+    ----------
+    cache : ResponseCache, DiskCache or None
+        When given, successful responses are stored by request hash and an
+        identical later request is answered without calling any provider.
+        Requests sampled above *cache_max_temperature* bypass it, since
+        their output is meant to vary.
+    cache_max_temperature : float
+        Highest ``temperature`` that may be cached.  A request that does
+        not pass ``temperature`` is sampled at the adapter default (0.7), so
+        with the default of ``0.0`` only ``temperature=0`` requests are
+        cached.
+    cache_normalize : bool
+        Key the cache on case- and whitespace-normalized message text.
+    semantic_cache : SemanticCache or None
+        Consulted after an exact-cache miss: a request whose conversation is a
+        close paraphrase of an earlier one (same provider, model and other
+        parameters such as ``system``) reuses that earlier response.  Like
+        *cache*, it is bypassed above *cache_max_temperature*.
+    coalesce : bool
+        Deduplicate concurrent identical :meth:`call` / :meth:`acall`
+        requests: while one is in flight, callers with the same provider,
+        model, messages and parameters wait for it (awaiting, in async code)
+        and receive a copy of its response instead of issuing their own.
+    hedge_delay : float or None
+        Hedge :meth:`call` across the provider chain: if the running
+        providers have not succeeded after this many seconds, the next one is
+        started in parallel, and the first success wins.  A provider that
+        fails outright starts the next one at once.  Losing attempts that are
+        already running finish in the background and their results are
+        dropped.  ``None`` (the default) tries providers one after another,
+        which never pays for more than one request at a time.
+    adaptive_timeout : bool
+        Pass each provider a ``timeout=`` derived from its recent latency:
+        1.5x its p99, clamped to ``[5, max_wait]`` seconds, doubling on each
+        retry that follows a timeout.  Applies once a provider has
+        ``MIN_LATENCY_SAMPLES`` successful calls, and never when the caller
+        passes its own ``timeout``.  Adapters must accept the keyword (the
+        built-in ones do).
+    max_error_history : int
+        Most recent errors kept per request (and per provider attempt
+        chain); older ones are dropped.  ``attempts`` on an all-failed
+        response still counts every error.
     """
 
+    #: Successful calls remembered per provider for latency percentiles
+    LATENCY_WINDOW = 100
+    #: Samples needed before ``adaptive_timeout`` takes effect
+    MIN_LATENCY_SAMPLES = 10
+
     def __init__(
         self,
         primary_provider: str | None = None,
-        fallback_providers: list[str] | None = None,
+        fallback_providers: Sequence[str] | None = None,
         max_retries: int | None = None,
         initial_wait: float | None = None,
         max_wait: float | None = None,
+        cache: ResponseCache | DiskCache | None = None,
+        cache_normalize: bool = False,
+        semantic_cache: SemanticCache | None = None,
+        coalesce: bool = False,
+        hedge_delay: float | None = None,
+        adaptive_timeout: bool = False,
+        max_error_history: int = 20,
+        cache_max_temperature: float = 0.0,
     ):
         self.primary_provider = (
             primary_provider or os.environ.get("LLM_PROVIDER", "openai")
@@ -45,18 +147,99 @@ class UnifiedLLMProvider:
         self.fallback_providers = (
             fallback_providers
             if fallback_providers is not None
-            else ["anthropic", "gemini", "openrouter", "ollama"]
+            else ("anthropic", "gemini", "openrouter", "ollama")
         )
-        self.max_retries = max_retries or int(
+        self._max_retries = max_retries or int(
             os.environ.get("LLM_MAX_RETRIES", "3")
         )
-        self.initial_wait = initial_wait or float(
+        self._initial_wait = initial_wait or float(
             os.environ.get("LLM_INITIAL_WAIT", "1")
         )
-        self.max_wait = max_wait or float(os.environ.get("LLM_MAX_WAIT", "30"))
+        self._max_wait = max_wait or float(os.environ.get("LLM_MAX_WAIT", "30"))
+        self._rebuild_backoff()
+        self.cache = cache
+        self.cache_normalize = cache_normalize
+        self.cache_max_temperature = cache_max_temperature
+        self.semantic_cache = semantic_cache
+        self.coalesce = coalesce
+        self.max_error_history = max_error_history
+        self.hedge_delay = hedge_delay
+        self.adaptive_timeout = adaptive_timeout
+        self._in_flight: dict[str, Future] = {}
+        self._in_flight_lock = threading.Lock()
 
         # Per-provider success/failure tracking
         self.provider_stats: dict[str, dict[str, Any]] = {}
+        self._stats_lock = threading.Lock()
+        # Welford sum of squared deviations of each provider's times
+        self._time_m2: dict[str, float] = {}
+        # Recent per-call latencies (seconds) of successful adapter calls
+        self._latencies: dict[str, deque[float]] = {}
+        # Bumped on every stats change; get_provider_stats() reuses its last
+        # report until it moves
+        self._stats_version = 0
+        self._stats_report: tuple[int, dict[str, Any]] | None = None
+
+    # -- provider order --------------------------------------------------------
+
+    @property
+    def fallback_providers(self) -> tuple[str, ...]:
+        return self._fallback_providers
+
+    @fallback_providers.setter
+    def fallback_providers(self, value: Sequence[str]) -> None:
+        self._fallback_providers = tuple(value)
+        # primary -> (primary, *fallbacks without it), filled on demand
+        self._chains: dict[str, tuple[str, ...]] = {}
+
+    # -- retry policy ----------------------------------------------------------
+    # Setting any of these rebuilds the precomputed backoff schedule.
+
+    @property
+    def max_retries(self) -> int:
+        return self._max_retries
+
+    @max_retries.setter
+    def max_retries(self, value: int) -> None:
+        self._max_retries = value
+        self._rebuild_backoff()
+
+    @property
+    def initial_wait(self) -> float:
+        return self._initial_wait
+
+    @initial_wait.setter
+    def initial_wait(self, value: float) -> None:
+        self._initial_wait = value
+        self._rebuild_backoff()
+
+    @property
+    def max_wait(self) -> float:
+        return self._max_wait
+
+    @max_wait.setter
+    def max_wait(self, value: float) -> None:
+        self._max_wait = value
+        self._rebuild_backoff()
+
+    @property
+    def _fast_path(self) -> bool:
+        """One provider, one attempt: call() can skip the chain and retry loops.
+
+        Evaluated per call so reassigning the public settings takes effect.
+        """
+        return (
+            not self._fallback_providers
+            and self._max_retries == 1
+            and self.hedge_delay is None
+        )
+
+    def _rebuild_backoff(self) -> None:
+        # Base sleep before retry i+1: exponential, capped at max_wait
+        self._backoff_schedule = tuple(
+            min(self._initial_wait * 2**i, self._max_wait)
+            for i in range(self._max_retries - 1)
+        )
 
     # -- public API ----------------------------------------------------------
 
@@ -67,6 +250,8 @@ class UnifiedLLMProvider:
         *,
         messages: list[dict] | None = None,
         provider: str | None = None,
+        cache: ResponseCache | DiskCache | None = None,
+        cache_prefix_boundary: int | None = None,
         **kwargs,
     ) -> LLMResponse:
         """Call the LLM with self-healing retry and provider fallback.
@@ -81,96 +266,577 @@ class UnifiedLLMProvider:
             Full conversation history.  When provided, *prompt* is ignored.
         provider :
             Override the primary provider for this call only.
+        cache :
+            Response cache for this call; defaults to the instance's *cache*.
+        cache_prefix_boundary :
+            Length of the stable message prefix (system prompt, few-shot
+            examples, ...).  Message ``cache_prefix_boundary - 1`` is sent
+            with ``cache_control: {"type": "ephemeral"}`` so providers with
+            prompt caching (Anthropic) can reuse that prefix.  It does not
+            affect response-cache keys.
         **kwargs :
             Extra keyword arguments forwarded to the adapter's ``call()``.
         """
+        messages = self._build_messages(prompt, messages)
+        start_time = time.monotonic()
+        sent = self._mark_cache_prefix(messages, cache_prefix_boundary)
+        hit, request_key, finish = self._check_caches(
+            messages, model, provider, cache, kwargs
+        )
+        if hit is not None:
+            return self._from_cache(hit, start_time)
+        messages = sent
+
+        def run_chain() -> LLMResponse:
+            error_history = _ErrorLog(self.max_error_history)
+            if self._fast_path and provider is None:
+                winner = self._run_single(
+                    messages, model, error_history, start_time, kwargs
+                )
+                if winner is None:
+                    return self._all_failed(model, error_history, start_time)
+                return finish(*winner, start_time)
+
+            chain = self._provider_chain(provider)
+            if self.hedge_delay is None:
+                winner = self._run_sequential(
+                    chain, messages, model, error_history, start_time, kwargs
+                )
+            else:
+                winner = self._run_hedged(
+                    chain, messages, model, error_history, start_time, kwargs
+                )
+            if winner is None:
+                return self._all_failed(model, error_history, start_time)
+            return finish(*winner, start_time)
+
+        if self.coalesce:
+            return self._coalesced(request_key, run_chain)
+        return run_chain()
+
+    async def acall(
+        self,
+        prompt: str | None = None,
+        model: str | None = None,
+        *,
+        messages: list[dict] | None = None,
+        provider: str | None = None,
+        cache: ResponseCache | DiskCache | None = None,
+        cache_prefix_boundary: int | None = None,
+        **kwargs,
+    ) -> LLMResponse:
+        """Asynchronous :meth:`call`.
+
+        Providers are called through ``adapter.acall()`` and retry backoff
+        uses ``asyncio.sleep``, so one event loop can run many requests
+        (and their retries) concurrently.  Accepts the same arguments as
+        :meth:`call`; ``hedge_delay`` applies to :meth:`call` only (see
+        :meth:`acall_hedged`).
+        """
+        messages = self._build_messages(prompt, messages)
+        start_time = time.monotonic()
+        sent = self._mark_cache_prefix(messages, cache_prefix_boundary)
+        hit, request_key, finish = await self._acheck_caches(
+            messages, model, provider, cache, kwargs
+        )
+        if hit is not None:
+            return self._from_cache(hit, start_time)
+        messages = sent
+
+        async def run_chain() -> LLMResponse:
+            error_history = _ErrorLog(self.max_error_history)
+            for provider_name in self._provider_chain(provider):
+                result = await self._try_provider_async(
+                    provider_name, messages, model, error_history, **kwargs
+                )
+                if result.success:
+                    return await finish(provider_name, result, start_time)
+                error_history.record(result)
+                self._update_stats(provider_name, False, time.monotonic() - start_time)
+            return self._all_failed(model, error_history, start_time)
+
+        if self.coalesce:
+            return await self._acoalesced(request_key, run_chain)
+        return await run_chain()
+
+    def call_many(
+        self,
+        prompts: list[str],
+        *,
+        max_concurrency: int = 8,
+        **kwargs,
+    ) -> list[LLMResponse]:
+        """Run :meth:`call` for each prompt on a thread pool.
+
+        Up to *max_concurrency* requests are in flight at once.  Results are
+        returned in the order of *prompts*; *kwargs* apply to every call.
+        """
+        if not prompts:
+            return []
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(prompts))) as pool:
+            return list(pool.map(lambda p: self.call(p, **kwargs), prompts))
+
+    async def acall_hedged(
+        self,
+        prompt: str | None = None,
+        model: str | None = None,
+        *,
+        messages: list[dict] | None = None,
+        provider: str | None = None,
+        hedge_delay: float = 0.5,
+        cache: ResponseCache | DiskCache | None = None,
+        cache_prefix_boundary: int | None = None,
+        **kwargs,
+    ) -> LLMResponse:
+        """Hedged variant of :meth:`call` for latency-sensitive callers.
+
+        The primary provider starts immediately.  If no provider has
+        succeeded after *hedge_delay* seconds, the next provider in the chain
+        is started in parallel (and so on); a provider that fails outright
+        triggers the next one at once.  The first success is returned and the
+        remaining attempts are cancelled, so a slow primary costs at most
+        *hedge_delay* instead of its full retry budget.  Caching and request
+        coalescing behave as in :meth:`acall`.
+        """
+        import asyncio
+
+        messages = self._build_messages(prompt, messages)
+        start_time = time.monotonic()
+        sent = self._mark_cache_prefix(messages, cache_prefix_boundary)
+        hit, request_key, finish = await self._acheck_caches(
+            messages, model, provider, cache, kwargs
+        )
+        if hit is not None:
+            return self._from_cache(hit, start_time)
+        messages = sent
+
+        async def run_hedged() -> LLMResponse:
+            error_history = _ErrorLog(self.max_error_history)
+            chain = iter(self._provider_chain(provider))
+            running: dict[asyncio.Task, str] = {}
+
+            def launch_next() -> bool:
+                name = next(chain, None)
+                if name is None:
+                    return False
+                task = asyncio.create_task(self._try_provider_async(
+                    name, messages, model, error_history, **kwargs
+                ))
+                running[task] = name
+                return True
+
+            more = launch_next()
+            try:
+                while running:
+                    done, _ = await asyncio.wait(
+                        running,
+                        timeout=hedge_delay if more else None,
+                        return_when=asyncio.FIRST_COMPLETED,
+                    )
+                    for task in done:
+                        provider_name = running.pop(task)
+                        result = task.result()
+                        if result.success:
+                            return await finish(provider_name, result, start_time)
+                        error_history.record(result)
+                        self._update_stats(
+                            provider_name, False, time.monotonic() - start_time
+                        )
+                    # Hedge on timeout, fall back on failure
+                    if more:
+                        more = launch_next()
+            finally:
+                for task in running:
+                    task.cancel()
+
+            return self._all_failed(model, error_history, start_time)
+
+        if self.coalesce:
+            return await self._acoalesced(request_key, run_hedged)
+        return await run_hedged()
+
+    def get_provider_stats(self) -> dict[str, Any]:
+        """Return per-provider success rates and response-time statistics.
+
+        ``avg_time`` and ``std_time`` are the mean and standard deviation of
+        the elapsed time recorded for each provider.  Providers with at least
+        two successful calls also report ``p50_time`` and ``p99_time``,
+        percentiles of recent adapter-call latency in seconds.  The report is
+        rebuilt only after stats change, so repeated calls return the same
+        object; treat it as read-only.
+        """
+        version = self._stats_version
+        cached = self._stats_report
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        report = {}
+        with self._stats_lock:
+            snapshot = [
+                (name, dict(stats), self._time_m2.get(name, 0.0))
+                for name, stats in self.provider_stats.items()
+            ]
+        for name, stats, m2 in snapshot:
+            total = stats["successes"] + stats["failures"]
+            report[name] = {
+                **stats,
+                "success_rate": stats["successes"] / max(total, 1),
+                "std_time": (m2 / (total - 1)) ** 0.5 if total > 1 else 0.0,
+            }
+            cuts = self._latency_quantiles(name)
+            if cuts is not None:
+                report[name]["p50_time"] = cuts[49]
+                report[name]["p99_time"] = cuts[98]
+        self._stats_report = (version, report)
+        return report
+
+    # -- internals -----------------------------------------------------------
+
+    @staticmethod
+    def _build_messages(
+        prompt: str | None, messages: list[dict] | None
+    ) -> list[dict]:
         if messages is None and prompt is None:
             raise ValueError("Either prompt or messages must be provided")
-
         if messages is None:
             messages = [{"role": "user", "content": prompt}]
+        return messages
 
-        start_time = time.time()
-        error_history: list[dict[str, Any]] = []
+    def _check_caches(
+        self,
+        messages: list[dict],
+        model: str | None,
+        provider: str | None,
+        cache: ResponseCache | DiskCache | None,
+        kwargs: dict[str, Any],
+    ) -> tuple[LLMResponse | None, str | None, Callable[..., LLMResponse]]:
+        """Look a request up in the exact and semantic caches.
 
-        # Build provider order
-        primary = provider or self.primary_provider
-        providers_to_try = [primary] + [
-            p for p in self.fallback_providers if p != primary
-        ]
+        Returns ``(hit, request_key, finish)``.  *hit* is a stored response
+        or ``None``; ``finish(provider_name, result, start_time)`` records a
+        successful provider result (stats, total time, caches) and returns it.
+        """
+        cache = cache if cache is not None else self.cache
+        semantic_cache = self.semantic_cache
+        request_key = None
+        if cache is not None or semantic_cache is not None or self.coalesce:
+            from dd_llm.cache import is_cacheable, make_cache_key, normalize_messages
+
+            if not is_cacheable(kwargs.get("temperature"), self.cache_max_temperature):
+                cache = semantic_cache = None
+        if cache is not None or self.coalesce:
+            request_key = make_cache_key(
+                provider or self.primary_provider,
+                model or "",
+                normalize_messages(messages) if self.cache_normalize else messages,
+                **kwargs,
+            )
+        if cache is not None:
+            hit = cache.get(request_key)
+            if hit is not None:
+                return hit, request_key, None
 
-        registered = set(list_adapters())
+        semantic_text = semantic_scope = None
+        if semantic_cache is not None:
+            semantic_text = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+            # Only the conversation is matched loosely; provider, model and
+            # every other parameter (system prompt, max_tokens, ...) must match
+            semantic_scope = make_cache_key(
+                provider or self.primary_provider, model or "", [], **kwargs
+            )
+            hit = semantic_cache.lookup(semantic_text, semantic_scope)
+            if hit is not None:
+                if cache is not None:
+                    cache.set(request_key, hit)
+                return hit, request_key, None
+
+        def finish(provider_name: str, result: LLMResponse, start_time: float) -> LLMResponse:
+            total_time = time.monotonic() - start_time
+            result.total_time = total_time
+            self._update_stats(provider_name, True, total_time)
+            if cache is not None:
+                cache.set(request_key, result)
+            if semantic_text is not None:
+                semantic_cache.add(semantic_text, result, semantic_scope)
+            return result
+
+        return None, request_key, finish
+
+    async def _acheck_caches(
+        self,
+        messages: list[dict],
+        model: str | None,
+        provider: str | None,
+        cache: ResponseCache | DiskCache | None,
+        kwargs: dict[str, Any],
+    ) -> tuple[LLMResponse | None, str | None, Callable[..., Awaitable[LLMResponse]]]:
+        """Async :meth:`_check_caches`; *finish* is a coroutine function.
+
+        Cache lookups and stores (SQLite for :class:`DiskCache`, embedding
+        for the semantic cache) run in a worker thread so they do not block
+        the event loop.
+        """
+        import asyncio
+
+        offload = (
+            cache is not None or self.cache is not None or self.semantic_cache is not None
+        )
+        if offload:
+            hit, request_key, finish = await asyncio.to_thread(
+                self._check_caches, messages, model, provider, cache, kwargs
+            )
+        else:
+            hit, request_key, finish = self._check_caches(
+                messages, model, provider, cache, kwargs
+            )
+        if finish is None:
+            return hit, request_key, None
 
-        for provider_name in providers_to_try:
-            if provider_name not in registered:
-                continue
+        async def afinish(provider_name: str, result: LLMResponse, start_time: float) -> LLMResponse:
+            if offload:
+                return await asyncio.to_thread(finish, provider_name, result, start_time)
+            return finish(provider_name, result, start_time)
 
+        return hit, request_key, afinish
+
+    @staticmethod
+    def _mark_cache_prefix(messages: list[dict], boundary: int | None) -> list[dict]:
+        """Copy of *messages* with a ``cache_control`` marker on message ``boundary - 1``."""
+        if boundary is None:
+            return messages
+        if not 1 <= boundary <= len(messages):
+            raise ValueError(
+                f"cache_prefix_boundary must be between 1 and {len(messages)}, got {boundary}"
+            )
+        marked = {**messages[boundary - 1], "cache_control": {"type": "ephemeral"}}
+        return [*messages[:boundary - 1], marked, *messages[boundary:]]
+
+    def _provider_chain(self, provider: str | None = None) -> list[str]:
+        """Registered providers to try, primary first."""
+        primary = provider or self.primary_provider
+        chain = self._chains.get(primary)
+        if chain is None:
+            chain = self._chains[primary] = (
+                primary, *(p for p in self.fallback_providers if p != primary)
+            )
+        return [p for p in chain if is_registered(p)]
+
+    def _run_sequential(
+        self,
+        chain: list[str],
+        messages: list[dict],
+        model: str | None,
+        error_history: _ErrorLog,
+        start_time: float,
+        kwargs: dict[str, Any],
+    ) -> tuple[str, LLMResponse] | None:
+        """Try *chain* in order; return the first ``(provider, success)``."""
+        for provider_name in chain:
             result = self._try_provider(
                 provider_name, messages, model, error_history, **kwargs
             )
-
             if result.success:
-                total_time = time.time() - start_time
-                result.total_time = total_time
-                self._update_stats(provider_name, True, total_time)
-                return result
+                return provider_name, result
+            error_history.record(result)
+            self._update_stats(provider_name, False, time.monotonic() - start_time)
+        return None
+
+    def _run_single(
+        self,
+        messages: list[dict],
+        model: str | None,
+        error_history: _ErrorLog,
+        start_time: float,
+        kwargs: dict[str, Any],
+    ) -> tuple[str, LLMResponse] | None:
+        """:meth:`_run_sequential` for the primary alone with one attempt."""
+        name = self.primary_provider
+        if not is_registered(name):
+            return None
+        adapter, result = self._resolve_adapter(name, model)
+        if adapter is not None:
+            timeout = self._effective_timeout(name, kwargs)
+            started = time.perf_counter()
+            try:
+                result = adapter.call(
+                    messages=messages,
+                    model=model or "",
+                    **(kwargs if timeout is None else {**kwargs, "timeout": timeout}),
+                )
+            except Exception as exc:
+                result = self._provider_failed(name, model, [_make_error_dict(name, 1, exc)])
+            else:
+                local_errors: list[dict[str, Any]] = []
+                if self._record_attempt(name, 0, result, local_errors):
+                    self._observe_latency(name, time.perf_counter() - started)
+                    return name, result
+                result = self._provider_failed(name, model, local_errors)
+        error_history.record(result)
+        self._update_stats(name, False, time.monotonic() - start_time)
+        return None
+
+    def _run_hedged(
+        self,
+        chain: list[str],
+        messages: list[dict],
+        model: str | None,
+        error_history: _ErrorLog,
+        start_time: float,
+        kwargs: dict[str, Any],
+    ) -> tuple[str, LLMResponse] | None:
+        """Thread-based counterpart of :meth:`acall_hedged`'s race."""
+        if not chain:
+            return None
+        from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+        pending = iter(chain)
+        running: dict[Future, str] = {}
+        pool = ThreadPoolExecutor(max_workers=len(chain))
+        # Set once the race is decided so losers stop retrying
+        cancelled = threading.Event()
+
+        def launch_next() -> bool:
+            name = next(pending, None)
+            if name is None:
+                return False
+            # Workers get a snapshot: this thread keeps extending the log
+            # while they read it for error context
+            future = pool.submit(
+                self._try_provider,
+                name, messages, model, tuple(error_history), cancelled, **kwargs
+            )
+            running[future] = name
+            return True
+
+        more = launch_next()
+        try:
+            while running:
+                done, _ = wait(
+                    running,
+                    timeout=self.hedge_delay if more else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                for future in done:
+                    provider_name = running.pop(future)
+                    result = future.result()
+                    if result.success:
+                        return provider_name, result
+                    error_history.record(result)
+                    self._update_stats(provider_name, False, time.monotonic() - start_time)
+                # Hedge on timeout, fall back on failure
+                if more:
+                    more = launch_next()
+        finally:
+            cancelled.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+        return None
+
+    def _join_in_flight(self, key: str) -> tuple[Future, bool]:
+        """Return the in-flight future for *key* and whether we must run it."""
+        from concurrent.futures import Future
+
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            if future is None:
+                future = self._in_flight[key] = Future()
+                return future, True
+            return future, False
+
+    def _settle_in_flight(
+        self, key: str, future: Future, result: LLMResponse | None, exc: BaseException | None
+    ) -> None:
+        with self._in_flight_lock:
+            del self._in_flight[key]
+        if exc is not None:
+            future.set_exception(exc)
+        else:
+            future.set_result(result)
+
+    def _coalesced(self, key: str, fn: Callable[[], LLMResponse]) -> LLMResponse:
+        """Run *fn* once per *key* at a time; concurrent callers share its result."""
+        future, leader = self._join_in_flight(key)
+        if not leader:
+            return dataclasses.replace(future.result())
+        try:
+            result = fn()
+        except BaseException as exc:
+            self._settle_in_flight(key, future, None, exc)
+            raise
+        self._settle_in_flight(key, future, result, None)
+        return result
 
-            error_history.extend(result.error_history or [])
-            self._update_stats(provider_name, False, time.time() - start_time)
+    async def _acoalesced(
+        self, key: str, fn: Callable[[], Awaitable[LLMResponse]]
+    ) -> LLMResponse:
+        """Async :meth:`_coalesced`; followers await the leader without blocking the loop.
+
+        Shares the in-flight table with :meth:`_coalesced`, so sync and async
+        callers of the same request are merged too.
+        """
+        import asyncio
+
+        future, leader = self._join_in_flight(key)
+        if not leader:
+            return dataclasses.replace(await asyncio.wrap_future(future))
+        try:
+            result = await fn()
+        except BaseException as exc:
+            self._settle_in_flight(key, future, None, exc)
+            raise
+        self._settle_in_flight(key, future, result, None)
+        return result
+
+    @staticmethod
+    def _from_cache(hit: LLMResponse, start_time: float) -> LLMResponse:
+        return dataclasses.replace(
+            hit,
+            latency_ms=0.0,
+            cost_usd=0.0,
+            cached=True,
+            total_time=time.monotonic() - start_time,
+        )
 
+    @staticmethod
+    def _all_failed(
+        model: str | None, error_history: _ErrorLog, start_time: float
+    ) -> LLMResponse:
         return LLMResponse(
             content="",
             success=False,
             provider="all_failed",
             model=model or "unknown",
-            attempts=len(error_history),
-            total_time=time.time() - start_time,
-            error_history=error_history,
+            attempts=error_history.total,
+            total_time=time.monotonic() - start_time,
+            error_history=list(error_history),
         )
 
-    def get_provider_stats(self) -> dict[str, Any]:
-        """Return per-provider success rates and average response times."""
-        return {
-            name: {
-                **stats,
-                "success_rate": stats["successes"]
-                / max(stats["successes"] + stats["failures"], 1),
-            }
-            for name, stats in self.provider_stats.items()
-        }
-
-    # -- internals -----------------------------------------------------------
-
     def _try_provider(
         self,
         provider_name: str,
         messages: list[dict],
         model: str | None,
-        global_errors: list[dict[str, Any]],
+        global_errors: Sequence[dict[str, Any]],
+        cancelled: threading.Event | None = None,
         **kwargs,
     ) -> LLMResponse:
-        """Try a single provider with exponential backoff and error-context injection."""
-        try:
-            adapter = get_adapter(provider_name)
-        except Exception as exc:
-            return LLMResponse(
-                content="",
-                success=False,
-                provider=provider_name,
-                model=model or "unknown",
-                error_history=[{
-                    "provider": provider_name,
-                    "attempt": 0,
-                    "error": str(exc),
-                    "error_type": type(exc).__name__,
-                    "timestamp": time.time(),
-                }],
-            )
+        """Try a single provider with exponential backoff and error-context injection.
+
+        When *cancelled* is set (a hedged race was won elsewhere), no further
+        attempts are made and the backoff sleep is cut short.
+        """
+        adapter, failure = self._resolve_adapter(provider_name, model)
+        if failure is not None:
+            return failure
 
-        wait_time = self.initial_wait
-        local_errors: list[dict[str, Any]] = []
+        local_errors: deque[dict[str, Any]] = deque(maxlen=self.max_error_history)
+        timeout = self._effective_timeout(provider_name, kwargs)
 
         for attempt in range(self.max_retries):
+            if cancelled is not None and cancelled.is_set():
+                break
+            call_kwargs = kwargs if timeout is None else {**kwargs, "timeout": timeout}
             try:
                 # On retries, inject error context so the LLM can self-correct
                 effective_messages = (
@@ -179,38 +845,148 @@ class UnifiedLLMProvider:
                     else messages
                 )
 
+                started = time.perf_counter()
                 result = adapter.call(
-                    messages=effective_messages, model=model or "", **kwargs
+                    messages=effective_messages, model=model or "", **call_kwargs
                 )
-
-                if result.success:
-                    result.attempts = attempt + 1
-                    result.error_history = local_errors or None
+                if self._record_attempt(provider_name, attempt, result, local_errors):
+                    self._observe_latency(provider_name, time.perf_counter() - started)
                     return result
 
-                # Adapter returned failure without raising
-                local_errors.append({
-                    "provider": provider_name,
-                    "attempt": attempt + 1,
-                    "error": (result.error_history or [{}])[-1].get("error", "unknown"),
-                    "error_type": "AdapterFailure",
-                    "timestamp": time.time(),
-                })
+            except Exception as exc:
+                local_errors.append(_make_error_dict(provider_name, attempt + 1, exc))
+
+            if timeout is not None and self._is_timeout(local_errors[-1]):
+                timeout *= 2
+            if attempt < self.max_retries - 1:
+                if cancelled is None:
+                    time.sleep(self._backoff(attempt))
+                elif cancelled.wait(self._backoff(attempt)):
+                    break
+
+        return self._provider_failed(provider_name, model, local_errors)
+
+    async def _try_provider_async(
+        self,
+        provider_name: str,
+        messages: list[dict],
+        model: str | None,
+        global_errors: Sequence[dict[str, Any]],
+        **kwargs,
+    ) -> LLMResponse:
+        """:meth:`_try_provider` using ``adapter.acall()`` and ``asyncio.sleep``."""
+        import asyncio
+
+        adapter, failure = self._resolve_adapter(provider_name, model)
+        if failure is not None:
+            return failure
+
+        local_errors: deque[dict[str, Any]] = deque(maxlen=self.max_error_history)
+        timeout = self._effective_timeout(provider_name, kwargs)
+
+        for attempt in range(self.max_retries):
+            call_kwargs = kwargs if timeout is None else {**kwargs, "timeout": timeout}
+            try:
+                effective_messages = (
+                    self._add_error_context(messages, local_errors, global_errors)
+                    if attempt > 0
+                    else messages
+                )
+
+                started = time.perf_counter()
+                result = await adapter.acall(
+                    messages=effective_messages, model=model or "", **call_kwargs
+                )
+                if self._record_attempt(provider_name, attempt, result, local_errors):
+                    self._observe_latency(provider_name, time.perf_counter() - started)
+                    return result
 
             except Exception as exc:
-                local_errors.append({
-                    "provider": provider_name,
-                    "attempt": attempt + 1,
-                    "error": str(exc),
-                    "error_type": type(exc).__name__,
-                    "timestamp": time.time(),
-                })
+                local_errors.append(_make_error_dict(provider_name, attempt + 1, exc))
 
+            if timeout is not None and self._is_timeout(local_errors[-1]):
+                timeout *= 2
             if attempt < self.max_retries - 1:
-                jitter = random.uniform(0.1, 0.3) * wait_time
-                time.sleep(wait_time + jitter)
-                wait_time = min(wait_time * 2, self.max_wait)
+                await asyncio.sleep(self._backoff(attempt))
+
+        return self._provider_failed(provider_name, model, local_errors)
+
+    def _observe_latency(self, provider_name: str, elapsed: float) -> None:
+        with self._stats_lock:
+            window = self._latencies.get(provider_name)
+            if window is None:
+                window = self._latencies[provider_name] = deque(maxlen=self.LATENCY_WINDOW)
+            window.append(elapsed)
+            self._stats_version += 1
+
+    def _latency_quantiles(self, provider_name: str) -> list[float] | None:
+        """Percentile cut points (99 of them) of recent latency, or ``None``."""
+        with self._stats_lock:
+            samples = list(self._latencies.get(provider_name, ()))
+        if len(samples) < 2:
+            return None
+        import statistics
+
+        return statistics.quantiles(samples, n=100, method="inclusive")
+
+    def _effective_timeout(self, provider_name: str, kwargs: dict[str, Any]) -> float | None:
+        """Latency-derived ``timeout`` for *provider_name*, or ``None`` to send none."""
+        if not self.adaptive_timeout or "timeout" in kwargs:
+            return None
+        if len(self._latencies.get(provider_name, ())) < self.MIN_LATENCY_SAMPLES:
+            return None
+        p99 = self._latency_quantiles(provider_name)[98]
+        return min(max(p99 * 1.5, 5.0), self.max_wait)
 
+    @staticmethod
+    def _is_timeout(error: dict[str, Any]) -> bool:
+        return "timeout" in error["error_type"].lower() or "timed out" in error["error"]
+
+    def _backoff(self, attempt: int) -> float:
+        """Seconds to sleep after failed *attempt*: schedule entry plus 10-30% jitter."""
+        return self._backoff_schedule[attempt] * (1.1 + 0.2 * _rand())
+
+    @staticmethod
+    def _resolve_adapter(
+        provider_name: str, model: str | None
+    ) -> tuple[LLMAdapter | None, LLMResponse | None]:
+        """Return ``(adapter, None)``, or ``(None, failure)`` if it cannot be built."""
+        try:
+            return get_adapter(provider_name), None
+        except Exception as exc:
+            return None, LLMResponse(
+                content="",
+                success=False,
+                provider=provider_name,
+                model=model or "unknown",
+                error_history=[_make_error_dict(provider_name, 0, exc)],
+            )
+
+    @staticmethod
+    def _record_attempt(
+        provider_name: str,
+        attempt: int,
+        result: LLMResponse,
+        local_errors: MutableSequence[dict[str, Any]],
+    ) -> bool:
+        """Finalise a successful *result*, or log an adapter-reported failure."""
+        if result.success:
+            result.attempts = attempt + 1
+            result.error_history = list(local_errors) or None
+            return True
+        # Adapter returned failure without raising
+        local_errors.append({
+            "provider": provider_name,
+            "attempt": attempt + 1,
+            "error": (result.error_history or [{}])[-1].get("error", "unknown"),
+            "error_type": "AdapterFailure",
+            "timestamp": time.time(),
+        })
+        return False
+
+    def _provider_failed(
+        self, provider_name: str, model: str | None, local_errors: Sequence[dict[str, Any]]
+    ) -> LLMResponse:
         return LLMResponse(
             content="",
             success=False,
@@ -218,39 +994,49 @@ class UnifiedLLMProvider:
             model=model or "unknown",
             attempts=self.max_retries,
             total_time=0.0,
-            error_history=local_errors,
+            error_history=list(local_errors),
         )
 
     @staticmethod
     def _add_error_context(
         original_messages: list[dict],
-        local_errors: list[dict[str, Any]],
-        global_errors: list[dict[str, Any]],
+        local_errors: Sequence[dict[str, Any]],
+        global_errors: Sequence[dict[str, Any]],
     ) -> list[dict]:
         """Inject recent error context so the LLM can self-correct."""
-        recent = (local_errors + global_errors)[-3:]
+        # Same as (local_errors + global_errors)[-3:] without building the sum
+        recent = list(itertools.islice(
+            itertools.chain(reversed(global_errors), reversed(local_errors)), 3
+        ))[::-1]
         if not recent:
             return original_messages
 
-        lines = ["Previous attempts failed with the following errors:"]
-        for i, err in enumerate(recent, 1):
-            lines.append(f"{i}. {err['error_type']}: {err['error']}")
-        lines.append("")
-        lines.append("Please analyse these errors and provide a corrected response.")
-
-        return original_messages + [{"role": "user", "content": "\n".join(lines)}]
+        content = "\n".join(itertools.chain(
+            (_ERROR_CONTEXT_HEADER,),
+            (f"{i}. {err['error_type']}: {err['error']}" for i, err in enumerate(recent, 1)),
+            (_ERROR_CONTEXT_FOOTER,),
+        ))
+        return [*original_messages, {"role": "user", "content": content}]
 
     def _update_stats(self, provider_name: str, success: bool, elapsed: float):
-        if provider_name not in self.provider_stats:
-            self.provider_stats[provider_name] = {
-                "successes": 0,
-                "failures": 0,
-                "avg_time": 0.0,
-            }
-        stats = self.provider_stats[provider_name]
-        if success:
-            stats["successes"] += 1
-        else:
-            stats["failures"] += 1
-        total = stats["successes"] + stats["failures"]
-        stats["avg_time"] = (stats["avg_time"] * (total - 1) + elapsed) / total
+        with self._stats_lock:
+            if provider_name not in self.provider_stats:
+                self.provider_stats[provider_name] = {
+                    "successes": 0,
+                    "failures": 0,
+                    "avg_time": 0.0,
+                }
+            stats = self.provider_stats[provider_name]
+            if success:
+                stats["successes"] += 1
+            else:
+                stats["failures"] += 1
+            # Welford's update: numerically stable running mean and variance
+            total = stats["successes"] + stats["failures"]
+            delta = elapsed - stats["avg_time"]
+            stats["avg_time"] += delta / total
+            self._time_m2[provider_name] = (
+                self._time_m2.get(provider_name, 0.0)
+                + delta * (elapsed - stats["avg_time"])
+            )
+            self._stats_version += 1
@@ -6,6 +6,7 @@ register custom LLM adapters and retrieve them by name.
 
 from __future__ import annotations
 
+import functools
 from typing import Callable
 
 from dd_llm.base import LLMAdapter
@@ -13,6 +14,12 @@ from dd_llm.base import LLMAdapter
 # Maps provider name -> class or callable that returns an LLMAdapter
 _ADAPTER_REGISTRY: dict[str, type[LLMAdapter] | Callable[..., LLMAdapter]] = {}
 
+# Bumped by register_adapter() so derived views (sorted names, name set) are
+# rebuilt only when the registry changes.  The registry size is checked too,
+# which catches direct edits of _ADAPTER_REGISTRY (e.g. test fixtures).
+_REGISTRY_VERSION = 0
+_names_cache: tuple[tuple[int, int], tuple[str, ...], frozenset[str]] | None = None
+
 
 def register_adapter(
     name: str, adapter_cls_or_factory: type[LLMAdapter] | Callable[..., LLMAdapter]
@@ -21,17 +28,70 @@ def register_adapter(
 
     Accepts either an ``LLMAdapter`` subclass or a callable that returns one.
     """
+    global _REGISTRY_VERSION
     _ADAPTER_REGISTRY[name] = adapter_cls_or_factory
+    _REGISTRY_VERSION += 1
+    _build_adapter.cache_clear()
+
+
+def _names() -> tuple[tuple[str, ...], frozenset[str]]:
+    """Sorted registered names and the same names as a set, cached."""
+    global _names_cache
+    stamp = (_REGISTRY_VERSION, len(_ADAPTER_REGISTRY))
+    cached = _names_cache
+    if cached is None or cached[0] != stamp:
+        names = tuple(sorted(_ADAPTER_REGISTRY))
+        cached = _names_cache = (stamp, names, frozenset(names))
+    return cached[1], cached[2]
+
+
+@functools.lru_cache(maxsize=64)
+def _build_adapter(
+    factory: type[LLMAdapter] | Callable[..., LLMAdapter],
+    kwargs_key: tuple[tuple[str, object], ...],
+) -> LLMAdapter:
+    return factory(**dict(kwargs_key))
 
 
 def get_adapter(name: str, **kwargs) -> LLMAdapter:
-    """Get an adapter instance by name."""
-    if name not in _ADAPTER_REGISTRY:
+    """Get an adapter instance by name.
+
+    Instances are shared: repeated calls with the same name and keyword
+    arguments return the same adapter (for up to 64 combinations), so its
+    SDK client and connection pool are reused.  Adapters must therefore be
+    safe to reuse across calls and threads.  Keyword arguments that are not
+    hashable always build a fresh instance.
+    """
+    factory = _ADAPTER_REGISTRY.get(name)
+    if factory is None:
         available = ", ".join(sorted(_ADAPTER_REGISTRY.keys()))
         raise ValueError(f"Unknown adapter '{name}'. Available: {available}")
-    return _ADAPTER_REGISTRY[name](**kwargs)
+    # Keyed on the factory itself, so re-registering a name never serves
+    # an instance built by the old factory
+    kwargs_key = tuple(sorted(kwargs.items()))
+    if not _hashable(kwargs_key):
+        return factory(**kwargs)
+    return _build_adapter(factory, kwargs_key)
+
+
+def _hashable(value: object) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def is_registered(name: str) -> bool:
+    """Return whether an adapter is registered under *name*."""
+    return name in _ADAPTER_REGISTRY
+
+
+def registered_names() -> frozenset[str]:
+    """Registered adapter names as a frozenset, rebuilt only when the registry changes."""
+    return _names()[1]
 
 
 def list_adapters() -> list[str]:
     """List registered adapter names."""
-    return sorted(_ADAPTER_REGISTRY.keys())
+    return list(_names()[0])
@@ -0,0 +1,232 @@
+"""Semantic response caching.
+
+Where :mod:`dd_llm.cache` only matches byte-identical requests,
+``SemanticCache`` matches *paraphrases*: prompts are embedded and a stored
+response is returned when the nearest previous prompt has cosine similarity
+at or above ``threshold``.
+
+Embeddings default to ``sentence-transformers`` and nearest-neighbour search
+uses ``faiss`` when installed (``pip install "dd-llm[semcache]"``); without
+faiss an exact pure-Python scan is used.  Both are lazy-imported.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import math
+import threading
+from typing import Any, Callable
+
+from dd_llm.base import LLMAdapter, LLMResponse
+from dd_llm.cache import DEFAULT_TEMPERATURE, copy_response, is_cacheable, make_cache_key
+
+EmbedFn = Callable[[str], list[float]]
+
+
+def _normalize(vec) -> list[float]:
+    values = [float(v) for v in vec]
+    norm = math.sqrt(sum(v * v for v in values)) or 1.0
+    return [v / norm for v in values]
+
+
+class _FlatIndex:
+    """Inner-product index over unit vectors (faiss when available)."""
+
+    def __init__(self):
+        self.vectors: list[list[float]] = []
+        self._faiss = None  # built lazily; False when faiss is unavailable
+
+    def add(self, vec: list[float]) -> None:
+        self.vectors.append(vec)
+        if self._faiss:
+            import numpy as np
+
+            self._faiss.add(np.asarray([vec], dtype="float32"))
+
+    def search(self, vec: list[float]) -> tuple[float, int]:
+        """Return ``(score, position)`` of the best match, or ``(-1.0, -1)``."""
+        if not self.vectors:
+            return -1.0, -1
+        if self._faiss is None:
+            self._faiss = self._build_faiss() or False
+        if self._faiss:
+            import numpy as np
+
+            scores, ids = self._faiss.search(np.asarray([vec], dtype="float32"), 1)
+            return float(scores[0][0]), int(ids[0][0])
+        return max(
+            (sum(a * b for a, b in zip(vec, other)), i)
+            for i, other in enumerate(self.vectors)
+        )
+
+    def _build_faiss(self):
+        try:
+            import faiss
+            import numpy as np
+        except ImportError:
+            return None
+        index = faiss.IndexFlatIP(len(self.vectors[0]))
+        index.add(np.asarray(self.vectors, dtype="float32"))
+        return index
+
+
+class SemanticCache:
+    """Embedding-indexed store of :class:`LLMResponse` objects.
+
+    Like :class:`~dd_llm.cache.ResponseCache`, responses are copied on the
+    way in and out.
+
+    Parameters
+    ----------
+    threshold : float
+        Minimum cosine similarity for a lookup to count as a hit.
+    embed : callable or None
+        ``embed(text) -> list[float]``.  Defaults to a sentence-transformers
+        model named by *model_name*, loaded on first use.
+    model_name : str
+        sentence-transformers model used when *embed* is not given.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.92,
+        embed: EmbedFn | None = None,
+        model_name: str = "all-MiniLM-L6-v2",
+    ):
+        self.threshold = threshold
+        self.model_name = model_name
+        self.hits = 0
+        self.misses = 0
+        self._embed_fn = embed
+        self._scopes: dict[str, tuple[_FlatIndex, list[LLMResponse]]] = {}
+        self._lock = threading.Lock()
+
+    def _embed(self, text: str) -> list[float]:
+        if self._embed_fn is None:
+            from sentence_transformers import SentenceTransformer
+
+            model = SentenceTransformer(self.model_name)
+            self._embed_fn = lambda t: model.encode(t).tolist()
+        return _normalize(self._embed_fn(text))
+
+    def lookup(self, text: str, scope: str = "") -> LLMResponse | None:
+        """Return the response stored for the closest prompt in *scope*, if close enough."""
+        vec = self._embed(text)
+        with self._lock:
+            entry = self._scopes.get(scope)
+            score, pos = entry[0].search(vec) if entry else (-1.0, -1)
+            if pos < 0 or score < self.threshold:
+                self.misses += 1
+                return None
+            self.hits += 1
+            hit = entry[1][pos]
+        return copy_response(hit)
+
+    def add(self, text: str, response: LLMResponse, scope: str = "") -> None:
+        """Index *text* and remember *response* for future lookups."""
+        vec = self._embed(text)
+        response = copy_response(response)
+        with self._lock:
+            index, responses = self._scopes.setdefault(scope, (_FlatIndex(), []))
+            index.add(vec)
+            responses.append(response)
+
+    def save(self, path: str) -> None:
+        """Write all vectors and responses to a JSON file at *path*."""
+        with self._lock:
+            data = {
+                scope: [
+                    {"vector": vec, "response": dataclasses.asdict(resp)}
+                    for vec, resp in zip(index.vectors, responses)
+                ]
+                for scope, (index, responses) in self._scopes.items()
+            }
+        with open(path, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+
+    def load(self, path: str) -> None:
+        """Merge entries previously written by :meth:`save`."""
+        with open(path, encoding="utf-8") as fh:
+            data: dict[str, list[dict[str, Any]]] = json.load(fh)
+        with self._lock:
+            for scope, entries in data.items():
+                index, responses = self._scopes.setdefault(scope, (_FlatIndex(), []))
+                for entry in entries:
+                    index.add(entry["vector"])
+                    responses.append(LLMResponse(**entry["response"]))
+
+    def __len__(self) -> int:
+        return sum(len(responses) for _, responses in self._scopes.values())
+
+
+class SemanticCacheAdapter(LLMAdapter):
+    """Adapter wrapper that answers paraphrased requests from a :class:`SemanticCache`.
+
+    Entries are scoped by model, system prompt and every other request
+    parameter, so a hit never crosses to a different model, persona or
+    ``max_tokens``.  The text that is embedded is the rendered conversation
+    (``role: content`` per line).  Requests sampled above *max_temperature*
+    bypass the cache, as in :class:`~dd_llm.cache.CachingAdapter`.
+    """
+
+    def __init__(
+        self,
+        inner: LLMAdapter,
+        cache: SemanticCache | None = None,
+        threshold: float = 0.92,
+        name: str | None = None,
+        max_temperature: float = 0.0,
+    ):
+        self.inner = inner
+        self.cache = cache if cache is not None else SemanticCache(threshold=threshold)
+        self.name = name or type(inner).__name__
+        self.max_temperature = max_temperature
+
+    def call(
+        self,
+        prompt: str = "",
+        *,
+        model: str = "",
+        messages: list[dict] | None = None,
+        system: str | None = None,
+        max_tokens: int = 4096,
+        temperature: float = DEFAULT_TEMPERATURE,
+        **kwargs,
+    ) -> LLMResponse:
+        call_kwargs = dict(
+            model=model,
+            messages=messages,
+            system=system,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs,
+        )
+        if not is_cacheable(temperature, self.max_temperature):
+            return self.inner.call(prompt, **call_kwargs)
+
+        if messages:
+            text = "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+        else:
+            text = prompt
+        scope = make_cache_key(
+            self.name,
+            model or getattr(self.inner, "default_model", ""),
+            [],
+            system=system,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs,
+        )
+
+        hit = self.cache.lookup(text, scope)
+        if hit is not None:
+            return dataclasses.replace(hit, latency_ms=0.0, cost_usd=0.0, cached=True)
+
+        result = self.inner.call(prompt, **call_kwargs)
+        if result.success:
+            self.cache.add(text, result, scope)
+        return result
+
+    def list_models(self) -> list[str]:
+        return self.inner.list_models()
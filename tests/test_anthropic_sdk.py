@@ -0,0 +1,101 @@
+"""Tests for AnthropicAdapter (mocked SDK client)."""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from dd_llm.adapters import anthropic_sdk
+from dd_llm.adapters.anthropic_sdk import AnthropicAdapter
+
+
+def _make_adapter(usage=None):
+    resp = SimpleNamespace(
+        content=[SimpleNamespace(text="hi there")],
+        usage=usage or SimpleNamespace(input_tokens=12, output_tokens=3),
+    )
+    client = MagicMock()
+    client.messages.create.return_value = resp
+    adapter = AnthropicAdapter(api_key="test")
+    adapter._client = client
+    return adapter, client
+
+
+class TestAnthropicAdapter:
+    def test_success(self):
+        adapter, client = _make_adapter()
+        resp = adapter.call("hello")
+        assert resp.success
+        assert resp.content == "hi there"
+        assert resp.input_tokens == 12
+        client.messages.create.assert_called_once()
+
+    def test_system_messages_are_lifted(self):
+        adapter, client = _make_adapter()
+        adapter.call(messages=[
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": "hello"},
+        ])
+        kwargs = client.messages.create.call_args.kwargs
+        assert kwargs["system"] == "Be brief."
+        assert kwargs["messages"] == [{"role": "user", "content": "hello"}]
+
+    def test_cache_control_becomes_content_block(self):
+        adapter, client = _make_adapter()
+        ephemeral = {"type": "ephemeral"}
+        adapter.call(messages=[
+            {"role": "system", "content": "Persona", "cache_control": ephemeral},
+            {"role": "user", "content": "q1", "cache_control": ephemeral},
+            {"role": "assistant", "content": "a1"},
+            {"role": "user", "content": "q2"},
+        ])
+        kwargs = client.messages.create.call_args.kwargs
+        assert kwargs["system"] == [
+            {"type": "text", "text": "Persona", "cache_control": ephemeral}
+        ]
+        assert kwargs["messages"][0] == {
+            "role": "user",
+            "content": [{"type": "text", "text": "q1", "cache_control": ephemeral}],
+        }
+        assert kwargs["messages"][2] == {"role": "user", "content": "q2"}
+
+    def test_cache_usage_reported(self):
+        usage = SimpleNamespace(
+            input_tokens=5, output_tokens=2,
+            cache_read_input_tokens=900, cache_creation_input_tokens=100,
+        )
+        adapter, _ = _make_adapter(usage)
+        resp = adapter.call("hello")
+        assert resp.cache_read_input_tokens == 900
+        assert resp.cache_creation_input_tokens == 100
+
+    def test_client_shared_across_instances(self, monkeypatch):
+        fake_sdk = MagicMock()
+        fake_sdk.Anthropic.side_effect = lambda **kw: MagicMock()
+        monkeypatch.setitem(sys.modules, "anthropic", fake_sdk)
+        monkeypatch.setattr(AnthropicAdapter, "_clients", {})
+        monkeypatch.setattr(anthropic_sdk, "shared_http_client", lambda: "pool")
+
+        a = AnthropicAdapter(api_key="k1")._get_client()
+        b = AnthropicAdapter(api_key="k1")._get_client()
+        c = AnthropicAdapter(api_key="k2")._get_client()
+        assert a is b
+        assert a is not c
+        assert fake_sdk.Anthropic.call_count == 2
+        assert fake_sdk.Anthropic.call_args.kwargs["http_client"] == "pool"
+
+    def test_acall_uses_async_client(self):
+        adapter, client = _make_adapter()
+        async_client = MagicMock()
+        async_client.messages.create = AsyncMock(
+            return_value=client.messages.create.return_value
+        )
+        adapter._get_async_client = lambda: async_client
+
+        resp = asyncio.run(adapter.acall("hello", system="Be brief."))
+        assert resp.success
+        assert resp.content == "hi there"
+        client.messages.create.assert_not_called()
+        kwargs = async_client.messages.create.call_args.kwargs
+        assert kwargs["system"] == "Be brief."
+        assert kwargs["messages"] == [{"role": "user", "content": "hello"}]
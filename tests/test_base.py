@@ -1,5 +1,8 @@
 """Tests for LLMAdapter ABC and LLMResponse dataclass."""
 
+import asyncio
+import time
+
 import pytest
 
 from dd_llm.base import LLMAdapter, LLMResponse
@@ -18,6 +21,12 @@ class TestLLMResponse:
         assert r.attempts == 1
         assert r.error_history is None
 
+    def test_slotted(self):
+        r = LLMResponse(content="hello", success=True, provider="test", model="m1")
+        assert not hasattr(r, "__dict__")
+        r.total_time = 1.5  # still mutable
+        assert r.total_time == 1.5
+
     def test_creation_full(self):
         r = LLMResponse(
             content="world",
@@ -75,3 +84,56 @@ class TestLLMAdapterABC:
         start = adapter._measure_time()
         elapsed = adapter._elapsed_ms(start)
         assert elapsed >= 0
+        # Subclasses may still combine it with time.perf_counter() directly
+        assert isinstance(start, float)
+        assert 0 <= time.perf_counter() - start < 60
+        assert adapter._elapsed_ms_ns(adapter._measure_time_ns()) >= 0
+
+    def test_acall_default_runs_call(self):
+        class DummyAdapter(LLMAdapter):
+            def call(self, prompt="", **kwargs):
+                return LLMResponse(
+                    content=f"{prompt}:{kwargs.get('model')}",
+                    success=True, provider="d", model="d",
+                )
+
+        adapter = DummyAdapter()
+
+        async def run():
+            return await asyncio.gather(
+                adapter.acall("a", model="m1"), adapter.acall("b", model="m2")
+            )
+
+        results = asyncio.run(run())
+        assert [r.content for r in results] == ["a:m1", "b:m2"]
+
+    def test_batch_call_preserves_order(self):
+        class DummyAdapter(LLMAdapter):
+            def call(self, prompt="", **kwargs):
+                return LLMResponse(
+                    content=prompt.upper(), success=True, provider="d", model="d"
+                )
+
+        results = DummyAdapter().batch_call(["a", "b", "c"], model="m")
+        assert [r.content for r in results] == ["A", "B", "C"]
+
+    def test_batch_call_respects_max_concurrency(self):
+        import threading
+        import time
+
+        state = {"active": 0, "peak": 0}
+        lock = threading.Lock()
+
+        class DummyAdapter(LLMAdapter):
+            def call(self, prompt="", **kwargs):
+                with lock:
+                    state["active"] += 1
+                    state["peak"] = max(state["peak"], state["active"])
+                time.sleep(0.02)
+                with lock:
+                    state["active"] -= 1
+                return LLMResponse(content=prompt, success=True, provider="d", model="d")
+
+        results = DummyAdapter().batch_call([str(i) for i in range(8)], max_concurrency=2)
+        assert [r.content for r in results] == [str(i) for i in range(8)]
+        assert state["peak"] <= 2
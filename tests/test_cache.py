@@ -0,0 +1,314 @@
+"""Tests for the exact-match response cache."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from dd_llm.base import LLMAdapter, LLMResponse
+from dd_llm.cache import (
+    CachingAdapter,
+    DiskCache,
+    ResponseCache,
+    make_cache_key,
+    normalize_messages,
+)
+from dd_llm.provider import UnifiedLLMProvider
+from dd_llm.registry import _ADAPTER_REGISTRY, register_adapter
+
+
+class _CountingAdapter(LLMAdapter):
+    def __init__(self, success=True):
+        self.calls = 0
+        self.success = success
+
+    def call(self, prompt="", **kwargs):
+        self.calls += 1
+        return LLMResponse(
+            content=f"reply {self.calls}",
+            success=self.success,
+            provider="count",
+            model="m",
+            latency_ms=120.0,
+            cost_usd=0.01,
+        )
+
+
+class TestMakeCacheKey:
+    def test_stable(self):
+        msgs = [{"role": "user", "content": "hi"}]
+        assert make_cache_key("p", "m", msgs, temperature=0) == make_cache_key(
+            "p", "m", msgs, temperature=0
+        )
+
+    def test_params_change_key(self):
+        msgs = [{"role": "user", "content": "hi"}]
+        assert make_cache_key("p", "m", msgs, temperature=0) != make_cache_key(
+            "p", "m", msgs, temperature=0.5
+        )
+        assert make_cache_key("p", "m", msgs) != make_cache_key("q", "m", msgs)
+
+
+class TestNormalizeMessages:
+    def test_case_and_whitespace(self):
+        msgs = [{"role": "user", "content": "  What IS\n ML? "}]
+        assert normalize_messages(msgs) == [{"role": "user", "content": "what is ml?"}]
+        assert msgs[0]["content"] == "  What IS\n ML? "  # input untouched
+
+
+class TestResponseCache:
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        r = LLMResponse(content="x", success=True, provider="p", model="m")
+        cache.set("a", r)
+        cache.set("b", r)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("c", r)
+        assert cache.get("b") is None
+        assert cache.get("a") == r
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self, monkeypatch):
+        import dd_llm.cache as cache_mod
+
+        now = [100.0]
+        monkeypatch.setattr(cache_mod.time, "monotonic", lambda: now[0])
+        cache = ResponseCache(ttl_seconds=10)
+        r = LLMResponse(content="x", success=True, provider="p", model="m")
+        cache.set("k", r)
+        now[0] = 109.0
+        assert cache.get("k") == r
+        now[0] = 110.0
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_shared_between_threads(self):
+        cache = ResponseCache(max_entries=8)
+        r = LLMResponse(content="x", success=True, provider="p", model="m")
+
+        def churn(offset):
+            for i in range(2000):
+                key = str((i + offset) % 16)
+                cache.set(key, r)
+                cache.get(key)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(churn, range(8)))
+        assert len(cache) == 8
+        assert cache.hits + cache.misses == 16000
+
+    def test_get_many(self):
+        cache = ResponseCache()
+        r = LLMResponse(content="x", success=True, provider="p", model="m")
+        cache.set_many({"a": r, "b": r})
+        assert cache.get_many(["a", "c"]) == {"a": r}
+
+    def test_hit_miss_counters(self):
+        cache = ResponseCache()
+        cache.get("missing")
+        cache.set("k", LLMResponse(content="", success=True, provider="p", model="m"))
+        cache.get("k")
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_stores_and_returns_copies(self):
+        cache = ResponseCache()
+        r = LLMResponse(
+            content="x", success=True, provider="p", model="m", error_history=[{"e": 1}]
+        )
+        cache.set("k", r)
+        r.error_history.append({"e": 2})
+        hit = cache.get("k")
+        hit.content = "edited"
+        assert cache.get("k").content == "x"
+        assert cache.get("k").error_history == [{"e": 1}]
+
+
+class TestDiskCache:
+    def test_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "llm.sqlite")
+        r = LLMResponse(content="x", success=True, provider="p", model="m", input_tokens=7)
+        first = DiskCache(path)
+        first.set("k", r)
+        first.close()
+
+        second = DiskCache(path)
+        assert second.get("k") == r
+        assert second.get("other") is None
+        assert (second.hits, second.misses) == (1, 1)
+        assert len(second) == 1
+        second.clear()
+        assert len(second) == 0
+
+    def test_get_many_and_set_many(self, tmp_path):
+        cache = DiskCache(str(tmp_path / "llm.sqlite"))
+        responses = {
+            f"k{i}": LLMResponse(content=str(i), success=True, provider="p", model="m")
+            for i in range(1200)  # spans several IN batches
+        }
+        cache.set_many(responses)
+        found = cache.get_many(["k0", "k999", "missing", "k1199", "k0"])
+        assert {k: r.content for k, r in found.items()} == {
+            "k0": "0", "k999": "999", "k1199": "1199",
+        }
+        assert (cache.hits, cache.misses) == (3, 1)
+        assert len(cache.get_many(responses)) == 1200
+
+
+class TestCachingAdapter:
+    def test_hit_is_a_copy(self):
+        adapter = CachingAdapter(_CountingAdapter())
+        adapter.call("hello", temperature=0).content = "edited"
+        assert adapter.call("hello", temperature=0).content == "reply 1"
+
+    def test_repeat_is_served_from_cache(self):
+        inner = _CountingAdapter()
+        adapter = CachingAdapter(inner)
+        first = adapter.call("hello", temperature=0)
+        second = adapter.call("hello", temperature=0)
+        assert inner.calls == 1
+        assert not first.cached
+        assert second.cached
+        assert second.content == first.content
+        assert second.latency_ms == 0.0
+        assert second.cost_usd == 0.0
+
+    def test_different_prompt_misses(self):
+        inner = _CountingAdapter()
+        adapter = CachingAdapter(inner)
+        adapter.call("hello", temperature=0)
+        adapter.call("goodbye", temperature=0)
+        assert inner.calls == 2
+
+    def test_high_temperature_bypasses_cache(self):
+        inner = _CountingAdapter()
+        adapter = CachingAdapter(inner)
+        adapter.call("hello", temperature=0.7)
+        adapter.call("hello", temperature=0.7)
+        assert inner.calls == 2
+        assert len(adapter.cache) == 0
+
+    def test_failures_are_not_cached(self):
+        inner = _CountingAdapter(success=False)
+        adapter = CachingAdapter(inner)
+        adapter.call("hello", temperature=0)
+        adapter.call("hello", temperature=0)
+        assert inner.calls == 2
+
+
+class TestProviderCache:
+    @pytest.fixture(autouse=True)
+    def _clean_registry(self):
+        saved = dict(_ADAPTER_REGISTRY)
+        yield
+        _ADAPTER_REGISTRY.clear()
+        _ADAPTER_REGISTRY.update(saved)
+
+    def test_repeat_skips_providers(self, tmp_path):
+        inner = _CountingAdapter()
+        register_adapter("_test_count", lambda: inner)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_count",
+            fallback_providers=[],
+            max_retries=1,
+            cache=DiskCache(str(tmp_path / "llm.sqlite")),
+        )
+        first = p.call("hello", temperature=0)
+        second = p.call("hello", temperature=0)
+        assert inner.calls == 1
+        assert second.cached and not first.cached
+        assert second.content == first.content
+
+        p.call("hello", temperature=0.5)
+        p.call("hello", temperature=0.5)
+        assert inner.calls == 3  # sampled requests bypass the cache
+
+    def test_normalized_keys(self):
+        inner = _CountingAdapter()
+        register_adapter("_test_count", lambda: inner)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_count",
+            fallback_providers=[],
+            max_retries=1,
+            cache=ResponseCache(),
+            cache_normalize=True,
+        )
+        p.call("What is ML?", temperature=0)
+        assert p.call("  what is   ml? ", temperature=0).cached
+        assert inner.calls == 1
+
+    def test_per_call_cache(self):
+        inner = _CountingAdapter()
+        register_adapter("_test_count", lambda: inner)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_count", fallback_providers=[], max_retries=1
+        )
+        cache = ResponseCache()
+        p.call("hello", cache=cache, temperature=0)
+        p.call("hello", cache=cache, temperature=0)
+        p.call("hello", temperature=0)
+        assert inner.calls == 2
+
+    def test_caller_mutation_does_not_leak_into_cache(self):
+        inner = _CountingAdapter()
+        register_adapter("_test_count", lambda: inner)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_count",
+            fallback_providers=[],
+            max_retries=1,
+            cache=ResponseCache(),
+        )
+        first = p.call("hello", temperature=0)
+        first.content = "edited"
+        first.error_history = [{"error": "mine"}]
+        hit = p.call("hello", temperature=0)
+        hit.content = "edited again"
+        again = p.call("hello", temperature=0)
+        assert again.cached and again.content == "reply 1"
+        assert again.error_history != [{"error": "mine"}]
+
+    def test_acall_keeps_cache_io_off_the_event_loop(self):
+        class _LoopCheckingCache(ResponseCache):
+            on_loop = []
+
+            def _check(self):
+                try:
+                    asyncio.get_running_loop()
+                    self.on_loop.append(True)
+                except RuntimeError:
+                    self.on_loop.append(False)
+
+            def get(self, key):
+                self._check()
+                return super().get(key)
+
+            def set(self, key, response):
+                self._check()
+                super().set(key, response)
+
+        inner = _CountingAdapter()
+        register_adapter("_test_count", lambda: inner)
+        cache = _LoopCheckingCache()
+        p = UnifiedLLMProvider(
+            primary_provider="_test_count", fallback_providers=[], max_retries=1, cache=cache
+        )
+        asyncio.run(p.acall("hello", temperature=0))
+        assert asyncio.run(p.acall("hello", temperature=0)).cached
+        assert cache.on_loop == [False, False, False]  # get, set, get
+
+    def test_unset_temperature_is_sampled(self):
+        inner = _CountingAdapter()
+        register_adapter("_test_count", lambda: inner)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_count",
+            fallback_providers=[],
+            max_retries=1,
+            cache=ResponseCache(),
+        )
+        p.call("hello")
+        assert not p.call("hello").cached
+        assert inner.calls == 2
+
+        p.cache_max_temperature = 1.0
+        p.call("hello")
+        assert p.call("hello").cached
+        assert inner.calls == 3
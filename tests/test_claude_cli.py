@@ -41,6 +41,14 @@ class TestClaudeCLIAdapter:
             assert not resp.success
             assert "timed out" in resp.error_history[0]["error"]
 
+    def test_per_call_timeout(self):
+        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("claude", 7)) as mock_run:
+            adapter = ClaudeCLIAdapter(timeout=300)
+            resp = adapter.call("hello", timeout=7)
+
+            assert mock_run.call_args.kwargs["timeout"] == 7
+            assert "after 7s" in resp.error_history[0]["error"]
+
     def test_nonzero_exit(self):
         mock_result = MagicMock()
         mock_result.returncode = 1
@@ -105,3 +113,59 @@ class TestClaudeCLIAdapter:
     def test_list_models(self):
         adapter = ClaudeCLIAdapter()
         assert adapter.list_models() == ["claude-cli"]
+
+
+class TestPrewarm:
+    @pytest.fixture
+    def echo_cli(self, tmp_path):
+        # Stand-in for ``claude -p``: echoes the prompt read from stdin
+        script = tmp_path / "fake-claude"
+        script.write_text("#!/bin/sh\ncat\n")
+        script.chmod(0o755)
+        return str(script)
+
+    def test_prompt_sent_over_stdin(self, echo_cli):
+        adapter = ClaudeCLIAdapter(cli_path=echo_cli, prewarm=True)
+        try:
+            first = adapter.call("hello", system="Be helpful")
+            second = adapter.call("again")
+        finally:
+            adapter.close()
+
+        assert first.success
+        assert first.content == "System: Be helpful\n\nUser: hello"
+        assert second.content == "again"
+        assert adapter._standby is None
+
+    def test_standby_is_replaced_after_each_call(self, echo_cli):
+        adapter = ClaudeCLIAdapter(cli_path=echo_cli, prewarm=True)
+        try:
+            adapter.call("one")
+            standby = adapter._standby
+            assert standby is not None and standby.poll() is None
+            adapter.call("two")
+            assert adapter._standby is not standby
+        finally:
+            adapter.close()
+
+    def test_cli_not_found(self):
+        adapter = ClaudeCLIAdapter(cli_path="/nonexistent/claude", prewarm=True)
+        resp = adapter.call("hello")
+        assert not resp.success
+        assert "not found" in resp.error_history[0]["error"]
+
+
+class TestTokenEstimate:
+    def test_fallback_is_four_chars_per_token(self, monkeypatch):
+        from dd_llm.adapters import claude_cli
+
+        monkeypatch.setattr(claude_cli, "_encoding", False)
+        assert claude_cli._estimate_tokens("x" * 40) == 10
+
+
+class TestDecodeStripped:
+    def test_output_is_stripped(self):
+        from dd_llm.adapters.claude_cli import _decode_stripped
+
+        assert _decode_stripped(b"\n  caf\xc3\xa9 \xe3\x80\x80\n") == "café"
+        assert _decode_stripped(b"\xff ok") == "� ok"
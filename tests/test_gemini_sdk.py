@@ -0,0 +1,37 @@
+"""Tests for GeminiAdapter (mocked SDK client)."""
+
+import asyncio
+import sys
+import weakref
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from dd_llm.adapters.gemini_sdk import GeminiAdapter
+
+
+class TestGeminiAdapter:
+    def test_async_client_per_event_loop(self, monkeypatch):
+        def make_client(**kw):
+            client = MagicMock()
+            client.aio.models.generate_content = AsyncMock(
+                return_value=SimpleNamespace(text="hi", usage_metadata=None)
+            )
+            return client
+
+        fake_genai = MagicMock()
+        fake_genai.Client.side_effect = make_client
+        monkeypatch.setitem(sys.modules, "google", SimpleNamespace(genai=fake_genai))
+        monkeypatch.setattr(GeminiAdapter, "_async_clients", weakref.WeakKeyDictionary())
+        adapter = GeminiAdapter(api_key="test")
+
+        async def twice():
+            first = await adapter.acall("hello")
+            second = await adapter.acall("hello")
+            return first, second
+
+        first, second = asyncio.run(twice())
+        assert first.content == second.content == "hi"
+        assert fake_genai.Client.call_count == 1
+
+        asyncio.run(adapter.acall("hello"))
+        assert fake_genai.Client.call_count == 2
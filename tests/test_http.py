@@ -0,0 +1,44 @@
+"""Tests for the shared HTTP client helpers."""
+
+import asyncio
+import weakref
+
+import pytest
+
+from dd_llm._http import _patch_response_json, per_loop
+
+
+class TestPerLoop:
+    def test_memoised_within_a_loop(self):
+        registry = weakref.WeakKeyDictionary()
+
+        async def twice():
+            first = per_loop(registry, "k", object)
+            return first, per_loop(registry, "k", object)
+
+        a, b = asyncio.run(twice())
+        assert a is b
+
+    def test_new_loop_gets_new_value(self):
+        registry = weakref.WeakKeyDictionary()
+
+        async def get():
+            return per_loop(registry, "k", object)
+
+        assert asyncio.run(get()) is not asyncio.run(get())
+
+
+class TestPatchResponseJson:
+    def test_parses_content_with_orjson(self):
+        pytest.importorskip("orjson")
+
+        class _Response:
+            content = b'{"a": [1, 2]}'
+
+            def json(self, **kwargs):
+                return "original"
+
+        assert _patch_response_json(_Response)
+        assert _patch_response_json(_Response)  # idempotent
+        assert _Response().json() == {"a": [1, 2]}
+        assert _Response().json(parse_float=str) == "original"
@@ -0,0 +1,73 @@
+"""Tests for OpenAIAdapter (mocked SDK client)."""
+
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from dd_llm.adapters.openai_sdk import OpenAIAdapter
+
+
+def _chunk(text=None, usage=None):
+    choices = [] if text is None else [SimpleNamespace(delta=SimpleNamespace(content=text))]
+    return SimpleNamespace(choices=choices, usage=usage)
+
+
+class _Stream:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+        self.closed = False
+
+    def __iter__(self):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+
+def _make_adapter(stream_chunks=None):
+    client = MagicMock()
+    client.chat.completions.create.return_value = (
+        _Stream(stream_chunks) if stream_chunks is not None else SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="hi"))],
+            usage=SimpleNamespace(prompt_tokens=4, completion_tokens=1),
+        )
+    )
+    adapter = OpenAIAdapter(api_key="test")
+    adapter._client = client
+    return adapter, client
+
+
+class TestOpenAIAdapter:
+    def test_success(self):
+        adapter, client = _make_adapter()
+        resp = adapter.call("hello", system="Be brief.")
+        assert resp.success
+        assert resp.content == "hi"
+        kwargs = client.chat.completions.create.call_args.kwargs
+        assert kwargs["messages"][0] == {"role": "system", "content": "Be brief."}
+        assert "stream" not in kwargs
+
+    def test_stream_collects_deltas_and_usage(self):
+        usage = SimpleNamespace(prompt_tokens=5, completion_tokens=3)
+        adapter, client = _make_adapter(
+            [_chunk("Hel"), _chunk("lo"), _chunk(None, usage=usage)]
+        )
+        resp = adapter.call("hello", stream=True)
+        assert resp.content == "Hello"
+        assert (resp.input_tokens, resp.output_tokens) == (5, 3)
+        kwargs = client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert client.chat.completions.create.return_value.closed
+
+    def test_required_keys_stop_stream_early(self):
+        pytest.importorskip("jiter")
+        pieces = ['{"sentiment": "pos', 'itive", ', '"confidence": 0.9, ', '"keywords": ["a"', ', "b"]}']
+        adapter, client = _make_adapter([_chunk(p) for p in pieces])
+        resp = adapter.call("classify", required_keys=["sentiment", "confidence"])
+        assert json.loads(resp.content) == {"sentiment": "positive", "confidence": 0.9}
+        assert client.chat.completions.create.return_value.consumed == 3
@@ -1,8 +1,13 @@
 """Tests for UnifiedLLMProvider — retry, fallback, stats."""
 
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 from dd_llm.base import LLMAdapter, LLMResponse
+from dd_llm.cache import ResponseCache
 from dd_llm.registry import _ADAPTER_REGISTRY, register_adapter
 from dd_llm.provider import UnifiedLLMProvider
 
@@ -32,6 +37,14 @@ class _FailThenSucceedAdapter(LLMAdapter):
         )
 
 
+class _SlowAdapter(LLMAdapter):
+    def call(self, prompt="", **kwargs):
+        time.sleep(0.3)
+        return LLMResponse(
+            content="slow", success=True, provider="slow", model="m"
+        )
+
+
 @pytest.fixture(autouse=True)
 def _clean_registry():
     saved = dict(_ADAPTER_REGISTRY)
@@ -75,6 +88,42 @@ class TestUnifiedLLMProvider:
         assert not result.success
         assert result.provider == "all_failed"
         assert result.error_history
+        assert [(e["attempt"], e["error_type"], e["error"]) for e in result.error_history] == [
+            (1, "RuntimeError", "always fails"),
+            (2, "RuntimeError", "always fails"),
+        ]
+
+    def test_error_history_is_bounded(self):
+        register_adapter("_test_fail", _FailAdapter)
+        register_adapter("_test_fail2", _FailAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_fail",
+            fallback_providers=["_test_fail2"],
+            max_retries=3,
+            initial_wait=0.001,
+            max_error_history=4,
+        )
+        result = p.call("hello")
+        assert result.attempts == 6
+        assert len(result.error_history) == 4
+        assert [e["provider"] for e in result.error_history] == [
+            "_test_fail", "_test_fail2", "_test_fail2", "_test_fail2"
+        ]
+
+    def test_attempts_counted_past_history_limit(self):
+        register_adapter("_test_fail", _FailAdapter)
+        register_adapter("_test_fail2", _FailAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_fail",
+            fallback_providers=["_test_fail2"],
+            max_retries=5,
+            initial_wait=0.001,
+            max_wait=0.001,
+            max_error_history=2,
+        )
+        for result in (p.call("hello"), asyncio.run(p.acall("hello"))):
+            assert result.attempts == 10
+            assert [e["provider"] for e in result.error_history] == ["_test_fail2"] * 2
 
     def test_retry_succeeds(self):
         # Adapter shared across retries — need a factory
@@ -91,6 +140,66 @@ class TestUnifiedLLMProvider:
         assert result.content == "recovered"
         assert result.attempts == 3
 
+    def test_error_context_uses_last_three_errors(self):
+        def err(n):
+            return {"error_type": "E", "error": str(n)}
+
+        msgs = [{"role": "user", "content": "hi"}]
+        for local, glob in [([], []), ([err(1)], []), ([err(1), err(2)], [err(3)]),
+                            ([err(1)], [err(2), err(3), err(4), err(5)])]:
+            out = UnifiedLLMProvider._add_error_context(msgs, local, glob)
+            expected = (local + glob)[-3:]
+            if not expected:
+                assert out is msgs
+                continue
+            assert out[:-1] == msgs and len(msgs) == 1
+            lines = out[-1]["content"].splitlines()
+            assert lines[0] == "Previous attempts failed with the following errors:"
+            assert lines[1:-2] == [f"{i}. E: {e['error']}" for i, e in enumerate(expected, 1)]
+            assert lines[-2:] == ["", "Please analyse these errors and provide a corrected response."]
+
+    def test_backoff_schedule(self):
+        p = UnifiedLLMProvider(max_retries=6, initial_wait=1, max_wait=5)
+        assert p._backoff_schedule == (1, 2, 4, 5, 5)
+        for attempt, base in enumerate(p._backoff_schedule):
+            assert 1.1 * base <= p._backoff(attempt) <= 1.3 * base
+
+    def test_chain_is_cached_and_filtered_per_call(self):
+        register_adapter("_test_ok", _SuccessAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_ok", fallback_providers=["_test_b", "_test_ok"]
+        )
+        assert p.fallback_providers == ("_test_b", "_test_ok")
+        assert p._provider_chain() == ["_test_ok"]
+        register_adapter("_test_b", _SuccessAdapter)
+        assert p._provider_chain() == ["_test_ok", "_test_b"]
+        assert p._provider_chain("_test_b") == ["_test_b", "_test_ok"]
+        assert set(p._chains) == {"_test_ok", "_test_b"}
+
+    def test_reassigning_fallbacks_resets_chains(self):
+        register_adapter("_test_fail", _FailAdapter)
+        register_adapter("_test_ok", _SuccessAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_fail", fallback_providers=["_test_fail"],
+            max_retries=2, initial_wait=0.001,
+        )
+        assert not p.call("hello").success
+        p.fallback_providers = ["_test_ok"]
+        assert p.fallback_providers == ("_test_ok",)
+        assert p._provider_chain() == ["_test_fail", "_test_ok"]
+        assert p.call("hello").success
+
+    def test_retry_policy_can_change_after_construction(self):
+        register_adapter("_test_fail", _FailAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_fail", fallback_providers=[], max_retries=2,
+            initial_wait=0.001, max_wait=0.001,
+        )
+        p.max_retries = 4
+        p.max_wait = 0.002
+        assert p._backoff_schedule == (0.001, 0.002, 0.002)
+        assert p.call("hello").attempts == 4
+
     def test_provider_override(self):
         register_adapter("_test_ok", _SuccessAdapter)
         register_adapter("_test_fail", _FailAdapter)
@@ -115,6 +224,22 @@ class TestUnifiedLLMProvider:
         assert stats["_test_ok"]["successes"] == 2
         assert stats["_test_ok"]["success_rate"] == 1.0
 
+    def test_stats_mean_and_std(self):
+        p = UnifiedLLMProvider(primary_provider="_test_ok", fallback_providers=[])
+        for elapsed in (1.0, 2.0, 3.0, 4.0):
+            p._update_stats("_test_ok", True, elapsed)
+        stats = p.get_provider_stats()["_test_ok"]
+        assert stats["avg_time"] == pytest.approx(2.5)
+        assert stats["std_time"] == pytest.approx(1.2909944)
+
+    def test_stats_report_reused_until_stats_change(self):
+        p = UnifiedLLMProvider(primary_provider="_test_ok", fallback_providers=[])
+        p._update_stats("_test_ok", False, 1.0)
+        first = p.get_provider_stats()
+        assert p.get_provider_stats() is first
+        p._update_stats("_test_ok", True, 1.0)
+        assert p.get_provider_stats()["_test_ok"]["successes"] == 1
+
     def test_requires_prompt_or_messages(self):
         p = UnifiedLLMProvider()
         with pytest.raises(ValueError, match="Either prompt or messages"):
@@ -127,3 +252,461 @@ class TestUnifiedLLMProvider:
         )
         result = p.call(messages=[{"role": "user", "content": "hi"}])
         assert result.success
+
+
+class _AsyncSleepAdapter(LLMAdapter):
+    def call(self, prompt="", **kwargs):
+        raise AssertionError("sync path used")
+
+    async def acall(self, prompt="", **kwargs):
+        await asyncio.sleep(0.1)
+        return LLMResponse(
+            content="async", success=True, provider="async", model="m"
+        )
+
+
+class TestFastPath:
+    @pytest.fixture
+    def provider(self, monkeypatch):
+        def no_chain(*args, **kwargs):
+            raise AssertionError("full retry path used")
+
+        monkeypatch.setattr(UnifiedLLMProvider, "_try_provider", no_chain)
+        return lambda name: UnifiedLLMProvider(
+            primary_provider=name, fallback_providers=[], max_retries=1
+        )
+
+    def test_success(self, provider):
+        register_adapter("_test_ok", _SuccessAdapter)
+        p = provider("_test_ok")
+        assert p._fast_path
+        result = p.call("hello")
+        assert result.content == "ok" and result.attempts == 1
+        assert p.get_provider_stats()["_test_ok"]["successes"] == 1
+
+    def test_failure(self, provider):
+        register_adapter("_test_fail", _FailAdapter)
+        p = provider("_test_fail")
+        result = p.call("hello")
+        assert result.provider == "all_failed" and result.attempts == 1
+        assert result.error_history[0]["error_type"] == "RuntimeError"
+        assert p.get_provider_stats()["_test_fail"]["failures"] == 1
+
+    def test_unregistered_primary(self, provider):
+        result = provider("_test_missing").call("hello")
+        assert result.provider == "all_failed" and result.attempts == 0
+
+    def test_follows_reassigned_settings(self):
+        register_adapter("_test_fail", _FailAdapter)
+        register_adapter("_test_ok", _SuccessAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_fail", fallback_providers=[], max_retries=1
+        )
+        assert p._fast_path
+        p.fallback_providers = ("_test_ok",)
+        assert not p._fast_path
+        assert p.call("hello").content == "ok"
+
+    def test_not_used_with_fallbacks_or_retries(self):
+        assert not UnifiedLLMProvider(fallback_providers=["x"], max_retries=1)._fast_path
+        assert not UnifiedLLMProvider(fallback_providers=[], max_retries=2)._fast_path
+
+
+class _RecordingAdapter(LLMAdapter):
+    seen: list = []
+
+    def call(self, prompt="", messages=None, **kwargs):
+        type(self).seen.append(messages)
+        return LLMResponse(content="ok", success=True, provider="rec", model="m")
+
+
+class TestCachePrefixBoundary:
+    MESSAGES = [
+        {"role": "system", "content": "long stable instructions"},
+        {"role": "user", "content": "example"},
+        {"role": "user", "content": "question"},
+    ]
+
+    @pytest.fixture(autouse=True)
+    def _register(self):
+        _RecordingAdapter.seen = []
+        register_adapter("_test_rec", _RecordingAdapter)
+
+    def test_marks_last_prefix_message(self):
+        p = UnifiedLLMProvider(primary_provider="_test_rec", fallback_providers=[])
+        p.call(messages=self.MESSAGES, cache_prefix_boundary=2)
+        sent = _RecordingAdapter.seen[0]
+        assert sent[1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in sent[0] and "cache_control" not in sent[2]
+        assert "cache_control" not in self.MESSAGES[1]
+
+    def test_marker_does_not_change_cache_key(self):
+        from dd_llm.cache import ResponseCache
+
+        p = UnifiedLLMProvider(
+            primary_provider="_test_rec", fallback_providers=[], cache=ResponseCache()
+        )
+        p.call(messages=self.MESSAGES, temperature=0)
+        assert p.call(messages=self.MESSAGES, cache_prefix_boundary=2, temperature=0).cached
+        assert len(_RecordingAdapter.seen) == 1
+
+    def test_out_of_range(self):
+        p = UnifiedLLMProvider(primary_provider="_test_rec", fallback_providers=[])
+        with pytest.raises(ValueError, match="cache_prefix_boundary"):
+            p.call(messages=self.MESSAGES, cache_prefix_boundary=4)
+
+
+class TestAsyncCall:
+    def test_uses_adapter_acall_concurrently(self):
+        register_adapter("_test_async", _AsyncSleepAdapter)
+        p = UnifiedLLMProvider(primary_provider="_test_async", fallback_providers=[])
+
+        async def run():
+            start = time.perf_counter()
+            results = await asyncio.gather(*(p.acall(f"q{i}") for i in range(20)))
+            return results, time.perf_counter() - start
+
+        results, elapsed = asyncio.run(run())
+        assert all(r.content == "async" for r in results)
+        assert elapsed < 1.0
+        assert p.get_provider_stats()["_test_async"]["successes"] == 20
+
+    def test_retry_and_fallback(self):
+        register_adapter("_test_fail", _FailAdapter)
+        flaky = _FailThenSucceedAdapter()
+        register_adapter("_test_flaky", lambda **kw: flaky)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_fail",
+            fallback_providers=["_test_flaky"],
+            max_retries=3,
+            initial_wait=0.01,
+        )
+        result = asyncio.run(p.acall("hello"))
+        assert result.content == "recovered"
+        assert result.attempts == 3
+        assert p.get_provider_stats()["_test_fail"]["failures"] == 1
+
+    def test_all_fail(self):
+        register_adapter("_test_fail", _FailAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_fail", fallback_providers=[], max_retries=1
+        )
+        result = asyncio.run(p.acall("hello"))
+        assert result.provider == "all_failed"
+
+
+class TestHedgedCall:
+    def test_primary_wins_when_fast(self):
+        register_adapter("_test_ok", _SuccessAdapter)
+        register_adapter("_test_slow", _SlowAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_ok", fallback_providers=["_test_slow"], max_retries=1
+        )
+        result = asyncio.run(p.acall_hedged("hello", hedge_delay=0.1))
+        assert result.content == "ok"
+        assert "_test_slow" not in p.get_provider_stats()
+
+    def test_hedge_beats_slow_primary(self):
+        register_adapter("_test_slow", _SlowAdapter)
+        register_adapter("_test_ok", _SuccessAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_slow", fallback_providers=["_test_ok"], max_retries=1
+        )
+
+        async def timed():
+            start = time.perf_counter()
+            result = await p.acall_hedged("hello", hedge_delay=0.05)
+            return result, time.perf_counter() - start
+
+        result, elapsed = asyncio.run(timed())
+        assert result.content == "ok"
+        assert elapsed < 0.3
+
+    def test_failure_triggers_fallback_immediately(self):
+        register_adapter("_test_fail", _FailAdapter)
+        register_adapter("_test_ok", _SuccessAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_fail",
+            fallback_providers=["_test_ok"],
+            max_retries=1,
+            initial_wait=0.01,
+        )
+        result = asyncio.run(p.acall_hedged("hello", hedge_delay=10))
+        assert result.success
+        assert p.get_provider_stats()["_test_fail"]["failures"] == 1
+
+    def test_all_fail(self):
+        register_adapter("_test_fail", _FailAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_fail", fallback_providers=[], max_retries=1
+        )
+        result = asyncio.run(p.acall_hedged("hello", hedge_delay=0.01))
+        assert not result.success
+        assert result.provider == "all_failed"
+
+    def test_uses_cache(self):
+        register_adapter("_test_ok", _SuccessAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_ok", fallback_providers=[], max_retries=1
+        )
+        cache = ResponseCache()
+
+        async def twice():
+            first = await p.acall_hedged("hello", temperature=0, cache=cache)
+            second = await p.acall_hedged("hello", temperature=0, cache=cache)
+            return first, second
+
+        first, second = asyncio.run(twice())
+        assert not first.cached
+        assert second.cached and second.content == "ok"
+        assert p.get_provider_stats()["_test_ok"]["successes"] == 1
+
+
+class _TimeoutRecorder(LLMAdapter):
+    """Times out the first time it gets a timeout, then succeeds."""
+
+    timeouts: list = []
+
+    def call(self, prompt="", timeout=None, **kwargs):
+        type(self).timeouts.append(timeout)
+        if timeout is not None and len(type(self).timeouts) == 1:
+            raise TimeoutError("request timed out")
+        return LLMResponse(content="ok", success=True, provider="t", model="m")
+
+
+class TestAdaptiveTimeout:
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        _TimeoutRecorder.timeouts = []
+
+    def _provider(self, **kw):
+        register_adapter("_test_timeout", _TimeoutRecorder)
+        return UnifiedLLMProvider(
+            primary_provider="_test_timeout",
+            fallback_providers=[],
+            max_retries=2,
+            initial_wait=0.01,
+            max_wait=60,
+            **kw,
+        )
+
+    def test_latency_percentiles_in_stats(self):
+        p = self._provider()
+        for _ in range(3):
+            p.call("hello")
+        stats = p.get_provider_stats()["_test_timeout"]
+        assert 0 <= stats["p50_time"] <= stats["p99_time"]
+        assert _TimeoutRecorder.timeouts == [None, None, None]
+
+    def test_percentiles_stay_within_observed_range(self):
+        p = self._provider()
+        p._observe_latency("_test_timeout", 1.0)
+        p._observe_latency("_test_timeout", 2.0)
+        cuts = p._latency_quantiles("_test_timeout")
+        assert cuts[49] == 1.5
+        assert 1.0 <= cuts[98] <= 2.0
+
+    def test_timeout_after_warmup_and_doubles_on_timeout(self):
+        p = self._provider(adaptive_timeout=True)
+        for _ in range(UnifiedLLMProvider.MIN_LATENCY_SAMPLES):
+            p.call("hello")
+        assert _TimeoutRecorder.timeouts == [None] * UnifiedLLMProvider.MIN_LATENCY_SAMPLES
+
+        _TimeoutRecorder.timeouts = []
+        result = p.call("hello")
+        assert result.success and result.attempts == 2
+        # Fast calls clamp to the 5s floor; the retry after a timeout doubles it
+        assert _TimeoutRecorder.timeouts == [5.0, 10.0]
+
+    def test_caller_timeout_wins(self):
+        p = self._provider(adaptive_timeout=True)
+        for _ in range(UnifiedLLMProvider.MIN_LATENCY_SAMPLES):
+            p.call("hello")
+        _TimeoutRecorder.timeouts = [None]  # skip the simulated timeout
+        p.call("hello", timeout=42)
+        assert _TimeoutRecorder.timeouts[-1] == 42
+
+
+class TestSyncHedging:
+    def test_hedge_beats_slow_primary(self):
+        register_adapter("_test_slow", _SlowAdapter)
+        register_adapter("_test_ok", _SuccessAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_slow",
+            fallback_providers=["_test_ok"],
+            max_retries=1,
+            hedge_delay=0.05,
+        )
+        start = time.perf_counter()
+        result = p.call("hello")
+        assert result.content == "ok"
+        assert time.perf_counter() - start < 0.25
+        assert p.get_provider_stats()["_test_ok"]["successes"] == 1
+
+    def test_primary_wins_when_fast(self):
+        register_adapter("_test_ok", _SuccessAdapter)
+        register_adapter("_test_slow", _SlowAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_ok",
+            fallback_providers=["_test_slow"],
+            max_retries=1,
+            hedge_delay=0.1,
+        )
+        assert p.call("hello").content == "ok"
+        assert "_test_slow" not in p.get_provider_stats()
+
+    def test_failure_triggers_fallback_immediately(self):
+        register_adapter("_test_fail", _FailAdapter)
+        register_adapter("_test_ok", _SuccessAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_fail",
+            fallback_providers=["_test_ok"],
+            max_retries=1,
+            hedge_delay=10,
+        )
+        start = time.perf_counter()
+        assert p.call("hello").success
+        assert time.perf_counter() - start < 1
+        assert p.get_provider_stats()["_test_fail"]["failures"] == 1
+
+    def test_workers_get_error_snapshot(self, monkeypatch):
+        register_adapter("_test_fail", _FailAdapter)
+        register_adapter("_test_ok", _SuccessAdapter)
+        seen = []
+        original = UnifiedLLMProvider._try_provider
+
+        def spy(self, name, messages, model, global_errors, *args, **kwargs):
+            seen.append((name, global_errors))
+            return original(self, name, messages, model, global_errors, *args, **kwargs)
+
+        monkeypatch.setattr(UnifiedLLMProvider, "_try_provider", spy)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_fail",
+            fallback_providers=["_test_ok"],
+            max_retries=1,
+            hedge_delay=10,
+        )
+        assert p.call("hello").success
+        assert [name for name, _ in seen] == ["_test_fail", "_test_ok"]
+        assert all(isinstance(errors, tuple) for _, errors in seen)
+        assert seen[1][1][0]["error"] == "always fails"
+
+    def test_loser_stops_retrying(self):
+        calls = []
+
+        class _SlowFail(LLMAdapter):
+            def call(self, prompt="", **kwargs):
+                calls.append(1)
+                time.sleep(0.1)
+                raise RuntimeError("slow failure")
+
+        register_adapter("_test_slow_fail", _SlowFail)
+        register_adapter("_test_ok", _SuccessAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_slow_fail",
+            fallback_providers=["_test_ok"],
+            max_retries=4,
+            initial_wait=0.01,
+            hedge_delay=0.05,
+        )
+        assert p.call("hello").content == "ok"
+        time.sleep(0.5)
+        assert len(calls) == 1
+
+    def test_all_fail(self):
+        register_adapter("_test_fail", _FailAdapter)
+        p = UnifiedLLMProvider(
+            primary_provider="_test_fail",
+            fallback_providers=[],
+            max_retries=1,
+            hedge_delay=0.01,
+        )
+        result = p.call("hello")
+        assert result.provider == "all_failed"
+        assert len(result.error_history) == 1
+
+
+class _EchoSlowAdapter(LLMAdapter):
+    def call(self, prompt="", messages=None, **kwargs):
+        time.sleep(0.05)
+        return LLMResponse(
+            content=messages[-1]["content"], success=True, provider="echo", model="m"
+        )
+
+
+class TestCallMany:
+    def test_results_in_prompt_order(self):
+        register_adapter("_test_echo", _EchoSlowAdapter)
+        p = UnifiedLLMProvider(primary_provider="_test_echo", fallback_providers=[])
+        prompts = [f"p{i}" for i in range(16)]
+        start = time.perf_counter()
+        results = p.call_many(prompts, max_concurrency=16)
+        assert [r.content for r in results] == prompts
+        assert time.perf_counter() - start < 0.5
+        assert p.get_provider_stats()["_test_echo"]["successes"] == 16
+
+    def test_empty(self):
+        p = UnifiedLLMProvider(primary_provider="_test_echo", fallback_providers=[])
+        assert p.call_many([]) == []
+
+
+class _CountingSlowAdapter(LLMAdapter):
+    calls = 0
+
+    def call(self, prompt="", **kwargs):
+        type(self).calls += 1
+        time.sleep(0.1)
+        return LLMResponse(
+            content="shared", success=True, provider="slow", model="m"
+        )
+
+
+class TestCoalescing:
+    def _provider(self, **kwargs):
+        _CountingSlowAdapter.calls = 0
+        register_adapter("_test_slow", _CountingSlowAdapter)
+        return UnifiedLLMProvider(
+            primary_provider="_test_slow", fallback_providers=[], max_retries=1, **kwargs
+        )
+
+    def test_concurrent_identical_calls_share_one_request(self):
+        p = self._provider(coalesce=True)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: p.call("same"), range(4)))
+        assert _CountingSlowAdapter.calls == 1
+        assert all(r.content == "shared" for r in results)
+        assert len({id(r) for r in results}) == 4  # each caller gets its own copy
+        assert not p._in_flight
+
+    def test_different_requests_are_not_merged(self):
+        p = self._provider(coalesce=True)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(p.call, ["a", "b"]))
+        assert _CountingSlowAdapter.calls == 2
+
+    def test_disabled_by_default(self):
+        p = self._provider()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(lambda _: p.call("same"), range(2)))
+        assert _CountingSlowAdapter.calls == 2
+
+    def test_concurrent_identical_acalls_share_one_request(self):
+        p = self._provider(coalesce=True)
+
+        async def run():
+            return await asyncio.gather(*(p.acall("same") for _ in range(4)))
+
+        results = asyncio.run(run())
+        assert _CountingSlowAdapter.calls == 1
+        assert all(r.content == "shared" for r in results)
+        assert len({id(r) for r in results}) == 4
+        assert not p._in_flight
+
+    def test_async_caller_joins_sync_request(self):
+        p = self._provider(coalesce=True)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            sync_result = pool.submit(p.call, "same")
+            time.sleep(0.02)
+            async_result = asyncio.run(p.acall("same"))
+        assert sync_result.result().content == async_result.content == "shared"
+        assert _CountingSlowAdapter.calls == 1
@@ -1,5 +1,8 @@
 """Tests for the adapter registry."""
 
+import subprocess
+import sys
+
 import pytest
 
 from dd_llm.base import LLMAdapter, LLMResponse
@@ -8,6 +11,8 @@ from dd_llm.registry import (
     register_adapter,
     get_adapter,
     list_adapters,
+    is_registered,
+    registered_names,
 )
 
 
@@ -58,6 +63,25 @@ class TestGetAdapter:
         adapter = get_adapter("kw_test", foo="bar")
         assert adapter.kwargs["foo"] == "bar"
 
+    def test_instances_are_reused(self):
+        register_adapter("reuse_test", _MockAdapter)
+        first = get_adapter("reuse_test", foo="bar")
+        assert get_adapter("reuse_test", foo="bar") is first
+        assert get_adapter("reuse_test", foo="baz") is not first
+
+    def test_unhashable_kwargs_build_fresh_instances(self):
+        register_adapter("fresh_test", _MockAdapter)
+        first = get_adapter("fresh_test", tools=["a"])
+        assert first.kwargs["tools"] == ["a"]
+        assert get_adapter("fresh_test", tools=["a"]) is not first
+
+    def test_reregistering_drops_old_instances(self):
+        register_adapter("rereg_test", _MockAdapter)
+        first = get_adapter("rereg_test")
+        register_adapter("rereg_test", lambda **kw: _MockAdapter(tag="new"))
+        assert get_adapter("rereg_test").kwargs == {"tag": "new"}
+        assert first.kwargs == {}
+
 
 class TestListAdapters:
     def test_list_contains_builtins(self):
@@ -69,3 +93,65 @@ class TestListAdapters:
     def test_list_sorted(self):
         names = list_adapters()
         assert names == sorted(names)
+
+    def test_list_reflects_new_registration(self):
+        before = list_adapters()
+        register_adapter("zz_listed", _MockAdapter)
+        after = list_adapters()
+        assert "zz_listed" in after and "zz_listed" not in before
+
+    def test_list_is_a_fresh_copy(self):
+        list_adapters().append("bogus")
+        assert "bogus" not in list_adapters()
+
+
+class TestIsRegistered:
+    def test_registered_and_unknown(self):
+        register_adapter("reg_test", _MockAdapter)
+        assert is_registered("reg_test")
+        assert is_registered("openai")
+        assert not is_registered("nonexistent_xyz")
+
+
+class TestRegisteredNames:
+    def test_frozenset_reused_until_registration(self):
+        names = registered_names()
+        assert isinstance(names, frozenset)
+        assert names == set(list_adapters())
+        assert registered_names() is names
+        register_adapter("names_test", _MockAdapter)
+        assert "names_test" in registered_names()
+        assert "names_test" not in names
+
+
+class TestLazyBuiltins:
+    def test_import_does_not_load_adapter_modules(self):
+        code = (
+            "import sys, dd_llm; "
+            "print(any(m.startswith('dd_llm.adapters.') for m in sys.modules))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_import_does_not_load_optional_machinery(self):
+        heavy = ["asyncio", "concurrent.futures", "statistics", "sqlite3",
+                 "dd_llm.cache", "dd_llm.semcache"]
+        code = f"import sys, dd_llm; print([m for m in {heavy!r} if m in sys.modules])"
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "[]"
+
+    def test_lazy_exports_resolve(self):
+        import dd_llm
+        from dd_llm.cache import CachingAdapter
+
+        assert dd_llm.CachingAdapter is CachingAdapter
+        assert "SemanticCache" in dir(dd_llm)
+
+    def test_factory_builds_adapter_on_demand(self):
+        from dd_llm.adapters.claude_cli import ClaudeCLIAdapter
+
+        assert isinstance(get_adapter("claude_cli"), ClaudeCLIAdapter)
@@ -0,0 +1,126 @@
+"""Tests for the semantic response cache (with a toy bag-of-words embedder)."""
+
+from dd_llm.base import LLMAdapter, LLMResponse
+from dd_llm.provider import UnifiedLLMProvider
+from dd_llm.registry import _ADAPTER_REGISTRY, register_adapter
+from dd_llm.semcache import SemanticCache, SemanticCacheAdapter
+
+_VOCAB = ["what", "is", "explain", "machine", "learning", "ml", "cats", "dogs"]
+
+
+def _embed(text):
+    words = text.lower().replace("?", "").replace(".", "").split()
+    return [float(words.count(w)) for w in _VOCAB]
+
+
+class _CountingAdapter(LLMAdapter):
+    def __init__(self):
+        self.calls = 0
+
+    def call(self, prompt="", **kwargs):
+        self.calls += 1
+        return LLMResponse(
+            content=f"answer {self.calls}", success=True, provider="c", model="m",
+            latency_ms=50.0, cost_usd=0.01,
+        )
+
+
+class TestSemanticCache:
+    def test_similar_prompt_hits(self):
+        cache = SemanticCache(threshold=0.8, embed=_embed)
+        r = LLMResponse(content="x", success=True, provider="p", model="m")
+        cache.add("What is machine learning?", r)
+        assert cache.lookup("Explain machine learning.") is None  # below 0.8
+        assert cache.lookup("what is machine learning") == r
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_scopes_are_isolated(self):
+        cache = SemanticCache(threshold=0.5, embed=_embed)
+        r = LLMResponse(content="x", success=True, provider="p", model="m")
+        cache.add("machine learning", r, scope="model-a")
+        assert cache.lookup("machine learning", scope="model-b") is None
+
+    def test_save_and_load(self, tmp_path):
+        path = str(tmp_path / "sem.json")
+        cache = SemanticCache(threshold=0.9, embed=_embed)
+        cache.add("cats", LLMResponse(content="meow", success=True, provider="p", model="m"))
+        cache.save(path)
+
+        restored = SemanticCache(threshold=0.9, embed=_embed)
+        restored.load(path)
+        assert len(restored) == 1
+        assert restored.lookup("cats").content == "meow"
+
+
+class TestSemanticCacheAdapter:
+    def test_paraphrase_served_from_cache(self):
+        inner = _CountingAdapter()
+        adapter = SemanticCacheAdapter(inner, SemanticCache(threshold=0.5, embed=_embed))
+        first = adapter.call("What is machine learning?", temperature=0)
+        second = adapter.call("Explain machine learning.", temperature=0)
+        third = adapter.call("cats and dogs", temperature=0)
+        assert inner.calls == 2
+        assert second.cached and second.content == first.content
+        assert second.cost_usd == 0.0
+        assert not third.cached
+
+    def test_scoped_by_parameters(self):
+        inner = _CountingAdapter()
+        adapter = SemanticCacheAdapter(inner, SemanticCache(threshold=0.5, embed=_embed))
+        adapter.call("What is machine learning?", temperature=0)
+        short = adapter.call("What is machine learning?", temperature=0, max_tokens=5)
+        assert not short.cached
+        assert inner.calls == 2
+
+    def test_sampled_requests_bypass_cache(self):
+        inner = _CountingAdapter()
+        adapter = SemanticCacheAdapter(inner, SemanticCache(threshold=0.5, embed=_embed))
+        adapter.call("What is machine learning?", temperature=1.0)
+        greedy = adapter.call("What is machine learning?", temperature=0)
+        again = adapter.call("What is machine learning?", temperature=1.0)
+        assert not greedy.cached and not again.cached
+        assert inner.calls == 3
+
+
+class TestProviderSemanticCache:
+    def test_paraphrase_skips_providers(self):
+        saved = dict(_ADAPTER_REGISTRY)
+        try:
+            inner = _CountingAdapter()
+            register_adapter("_test_count", lambda: inner)
+            p = UnifiedLLMProvider(
+                primary_provider="_test_count",
+                fallback_providers=[],
+                max_retries=1,
+                semantic_cache=SemanticCache(threshold=0.5, embed=_embed),
+            )
+            p.call("What is machine learning?", temperature=0)
+            hit = p.call("Explain machine learning.", temperature=0)
+            p.call("What is machine learning?", model="other-model", temperature=0)
+            assert inner.calls == 2
+            assert hit.cached and hit.content == "answer 1"
+        finally:
+            _ADAPTER_REGISTRY.clear()
+            _ADAPTER_REGISTRY.update(saved)
+
+    def test_scoped_by_parameters_and_bypassed_when_sampled(self):
+        saved = dict(_ADAPTER_REGISTRY)
+        try:
+            inner = _CountingAdapter()
+            register_adapter("_test_count", lambda: inner)
+            p = UnifiedLLMProvider(
+                primary_provider="_test_count",
+                fallback_providers=[],
+                max_retries=1,
+                semantic_cache=SemanticCache(threshold=0.5, embed=_embed),
+            )
+            pirate = p.call("what is ml", system="pirate", temperature=0)
+            lawyer = p.call("what is ml", system="lawyer", temperature=0)
+            assert not lawyer.cached and lawyer.content != pirate.content
+            assert p.call("what is ml", system="pirate", temperature=0).cached
+
+            p.call("what is ml", system="pirate", temperature=1.0)
+            assert inner.calls == 3
+        finally:
+            _ADAPTER_REGISTRY.clear()
+            _ADAPTER_REGISTRY.update(saved)